@@ -2,29 +2,102 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections import Counter
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
+from hashlib import sha256
 from time import perf_counter
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-from langgraph.graph import StateGraph
 from pydantic import BaseModel
 
-from .config import WorkflowConfig
+from .config import ExperimentConfig, TestConfiguration, WorkflowConfig
 from .exceptions import WorkflowExecutionError
-from .strategies import get_strategy
+from .strategies import GenerationStrategy, get_strategy
+
+if TYPE_CHECKING:  # pragma: no cover - used for type checking only
+    from langgraph.graph import StateGraph
 
 TInput = TypeVar("TInput", bound=BaseModel)
 TOutput = TypeVar("TOutput", bound=BaseModel)
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+_RUNNER: Optional["_AsyncRunner"] = None
+_RUNNER_LOCK = threading.Lock()
+
+_RESPONSE_CACHE_MAXSIZE = 1024
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+
+
+class _AsyncRunner:
+    """Run coroutines from synchronous code on one long-lived background event loop.
+
+    The loop runs forever in a daemon thread, so event loop setup and any connection
+    pools held by the model clients survive between calls and across workflows.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="tesseract-flow-loop", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run ``coroutine`` on the background loop and block until it completes."""
+
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            msg = "Cannot block on the background event loop from its own thread."
+            raise RuntimeError(msg)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+
+def _response_cache_key(
+    strategy_name: str,
+    prompt: str,
+    model: str,
+    parameters: Mapping[str, Any],
+) -> str:
+    """Return a deterministic cache key for a generation request."""
+
+    fingerprint = {
+        "strategy": strategy_name,
+        "model": model,
+        "prompt": prompt,
+        "parameters": dict(parameters),
+    }
+    serialized = json.dumps(fingerprint, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256(serialized.encode("utf-8")).hexdigest()
+
 
 class BaseWorkflowService(ABC, Generic[TInput, TOutput]):
     """Base class for workflow services orchestrated via LangGraph."""
 
+    # Upper bounds (in predicted output tokens) of the bins used by arun_many.
+    OUTPUT_TOKEN_BINS: ClassVar[Tuple[int, ...]] = (128, 512, 2048)
+
     def __init__(self, config: Optional[WorkflowConfig] = None) -> None:
         self.config = config or WorkflowConfig()
         self._compiled_graph: Optional[Any] = None
@@ -48,7 +121,11 @@ class BaseWorkflowService(ABC, Generic[TInput, TOutput]):
     def run(self, input_data: TInput) -> TOutput:
         """Execute the workflow synchronously and return validated output."""
 
-        compiled = self._compile_workflow()
+        extra = getattr(self.config, "model_extra", None) or {}
+        steps = None if extra.get("use_langgraph", False) else self._linear_steps()
+        if steps is None:
+            # Without linear steps the compiled graph runs as the only step.
+            steps = (self._compile_workflow().invoke,)
         started_at = datetime.now(tz=timezone.utc)
         start_perf = perf_counter()
         payload = input_data.model_dump(mode="python")
@@ -59,7 +136,9 @@ class BaseWorkflowService(ABC, Generic[TInput, TOutput]):
             ", ".join(sorted(payload.keys())),
         )
         try:
-            result = compiled.invoke(payload)
+            result = payload
+            for step in steps:
+                result = step(result)
         except Exception as exc:  # pragma: no cover - defensive guard
             raise WorkflowExecutionError("Workflow execution failed") from exc
 
@@ -77,6 +156,103 @@ class BaseWorkflowService(ABC, Generic[TInput, TOutput]):
         )
         return output
 
+    async def arun_many(
+        self,
+        test_configs: Sequence[TestConfiguration],
+        experiment_config: Optional[ExperimentConfig] = None,
+        *,
+        max_concurrency: Optional[int] = None,
+    ) -> List[TOutput]:
+        """Execute several test configurations concurrently on the running event loop.
+
+        Inputs are prepared one after another; only the model calls overlap. Prepared
+        tests are grouped into bins by :meth:`_predict_output_tokens` so short calls are
+        not queued behind long ones, and each bin gets its own share of
+        ``max_concurrency`` as a fixed pool of workers that take tests from the bin as
+        earlier calls complete. No more than ``max_concurrency`` calls are in flight
+        across all bins. Results are returned in ``test_configs`` order. Workflows opt
+        in by implementing :meth:`_prepare_async_run` and :meth:`_arun_prepared`.
+
+        When ``max_concurrency`` is omitted it is read from the ``max_parallel`` workflow
+        config extra, defaulting to 8.
+        """
+
+        if max_concurrency is None:
+            workflow_config = experiment_config.workflow_config if experiment_config else None
+            extra = getattr(workflow_config or self.config, "model_extra", None) or {}
+            max_concurrency = int(extra.get("max_parallel", 8))
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1."
+            raise ValueError(msg)
+
+        prepared = [
+            self._prepare_async_run(test_config, experiment_config)
+            for test_config in test_configs
+        ]
+        bins: Dict[int, List[int]] = {}
+        for index, state in enumerate(prepared):
+            bin_index = bisect.bisect_left(
+                self.OUTPUT_TOKEN_BINS, self._predict_output_tokens(state)
+            )
+            bins.setdefault(bin_index, []).append(index)
+
+        results: List[Optional[TOutput]] = [None] * len(prepared)
+        # Each bin rounds its share up to at least one worker, so the pools can add up to
+        # more than ``max_concurrency``; the shared slots keep the total within it.
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def _worker(pending: Iterator[int]) -> None:
+            # Workers pull the next test of their bin as soon as their previous call
+            # finishes, so each bin keeps a fixed pool however large the sweep.
+            for index in pending:
+                async with slots:
+                    raw = await self._arun_prepared(prepared[index])
+                results[index] = self._validate_output(raw)
+
+        try:
+            # The task group cancels the remaining workers as soon as one of them fails.
+            async with asyncio.TaskGroup() as group:
+                for indices in bins.values():
+                    limit = max(1, round(max_concurrency * len(indices) / len(prepared)))
+                    pending = iter(indices)
+                    for _ in range(min(limit, len(indices))):
+                        group.create_task(_worker(pending))
+        except ExceptionGroup as exc:
+            raise WorkflowExecutionError("Workflow execution failed") from exc.exceptions[0]
+        return [result for result in results if result is not None]
+
+    def _linear_steps(self) -> Optional[Sequence[Callable[[Any], Any]]]:
+        """Return the node callables of a straight-line graph, or ``None``.
+
+        Workflows whose graph is a single chain of nodes can return those nodes in
+        order so :meth:`run` calls them directly instead of going through LangGraph.
+        Setting the ``use_langgraph`` workflow config extra keeps the compiled graph, for
+        example to attach LangGraph callbacks or tracing.
+        """
+
+        return None
+
+    def _prepare_async_run(
+        self,
+        test_config: TestConfiguration,
+        experiment_config: Optional[ExperimentConfig],
+    ) -> Any:
+        """Build the per-test state consumed by :meth:`_arun_prepared`."""
+
+        msg = f"{self.__class__.__name__} does not support arun_many."
+        raise NotImplementedError(msg)
+
+    def _predict_output_tokens(self, state: Any) -> int:
+        """Estimate the output length of a prepared test for arun_many binning."""
+
+        return 0
+
+    async def _arun_prepared(self, state: Any) -> Any:
+        """Run one prepared test asynchronously and return the raw workflow result."""
+
+        msg = f"{self.__class__.__name__} does not support arun_many."
+        raise NotImplementedError(msg)
+
     @property
     def last_run_metadata(self) -> dict[str, Any] | None:
         """Metadata captured from the most recent execution."""
@@ -90,6 +266,99 @@ class BaseWorkflowService(ABC, Generic[TInput, TOutput]):
         self._compiled_graph = None
         self._last_run_metadata = None
 
+    @classmethod
+    def _runner(cls) -> _AsyncRunner:
+        """Return the process-wide runner shared by every workflow, starting it lazily."""
+
+        global _RUNNER
+        with _RUNNER_LOCK:
+            if _RUNNER is None:
+                _RUNNER = _AsyncRunner()
+            return _RUNNER
+
+    @staticmethod
+    def clear_response_cache() -> None:
+        """Drop all cached generation responses shared by workflow instances."""
+
+        _RESPONSE_CACHE.clear()
+
+    def _config_extras(
+        self, workflow_config: WorkflowConfig | Mapping[str, Any] | None = None
+    ) -> Mapping[str, Any]:
+        """Return the extra settings of ``workflow_config``, defaulting to ``self.config``.
+
+        ``workflow_config`` may also be the plain mapping form that
+        :attr:`ExperimentConfig.workflow_config` accepts.
+        """
+
+        if workflow_config is None:
+            workflow_config = self.config
+        if isinstance(workflow_config, Mapping):
+            return workflow_config
+        return workflow_config.model_extra or {}
+
+    def _response_cache_enabled(
+        self, workflow_config: WorkflowConfig | Mapping[str, Any] | None = None
+    ) -> bool:
+        """Return whether ``response_cache_enabled`` is set in the workflow config extras."""
+
+        return bool(self._config_extras(workflow_config).get("response_cache_enabled", False))
+
+    def _generate_cached(
+        self,
+        strategy: GenerationStrategy,
+        prompt: str,
+        *,
+        strategy_name: str,
+        model: str,
+        config: Mapping[str, Any],
+        use_cache: bool,
+    ) -> str:
+        """Invoke ``strategy`` synchronously, reusing cached responses when allowed.
+
+        Callers should only set ``use_cache`` for deterministic requests (temperature 0),
+        otherwise repeated prompts would collapse distinct samples into one.
+        """
+
+        return self._await_coroutine(
+            self._agenerate_cached(
+                strategy,
+                prompt,
+                strategy_name=strategy_name,
+                model=model,
+                config=config,
+                use_cache=use_cache,
+            )
+        )
+
+    async def _agenerate_cached(
+        self,
+        strategy: GenerationStrategy,
+        prompt: str,
+        *,
+        strategy_name: str,
+        model: str,
+        config: Mapping[str, Any],
+        use_cache: bool,
+    ) -> str:
+        """Awaitable form of :meth:`_generate_cached` for the running event loop."""
+
+        if not use_cache:
+            return await strategy.generate(prompt, model=model, config=config)
+
+        key = _response_cache_key(strategy_name, prompt, model, config)
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+            logger.debug("Response cache hit for %s", self.__class__.__name__)
+            return cached
+
+        result = await strategy.generate(prompt, model=model, config=config)
+        _RESPONSE_CACHE[key] = result
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+        return result
+
     # Built-in reasoning and verbalized sampling capabilities
 
     def generate(
@@ -351,14 +620,19 @@ class BaseWorkflowService(ABC, Generic[TInput, TOutput]):
         # If ranking parsing fails, return samples in original order
         return samples
 
+    @classmethod
+    def _await_coroutine(cls, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Execute async coroutine synchronously on the shared background event loop."""
+        return cls._runner().submit(coroutine)
+
     @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
+    def _coerce_float(value: Any, default: float) -> float:
+        """Coerce value to float with fallback."""
+        if isinstance(value, float):
+            return value
+        if value is None:
+            return default
         try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
+            return float(value)
+        except (TypeError, ValueError):
+            return default
@@ -527,23 +527,34 @@ class ExperimentRun(BaseModel):
     def record_result(self, result: TestResult) -> "ExperimentRun":
         """Record a new test result and recalculate utilities."""
 
+        return self.record_results((result,))
+
+    def record_results(self, results: Iterable[TestResult]) -> "ExperimentRun":
+        """Record several new test results with a single utility recalculation."""
+
         if self.status != "RUNNING":
             msg = "Results can only be recorded while experiment is RUNNING."
             raise ValueError(msg)
 
-        if any(existing.test_number == result.test_number for existing in self.results):
-            msg = "Result for this test number has already been recorded."
-            raise ValueError(msg)
+        new_results = list(results)
+        recorded = {existing.test_number for existing in self.results}
+        for result in new_results:
+            if result.test_number in recorded:
+                msg = "Result for this test number has already been recorded."
+                raise ValueError(msg)
+            recorded.add(result.test_number)
 
-        if len(self.results) >= len(self.test_configurations):
+        if len(self.results) + len(new_results) > len(self.test_configurations):
             msg = "All test results have already been recorded."
             raise ValueError(msg)
 
-        updated_results = [*self.results, result]
+        updated_results = [*self.results, *new_results]
         recalculated_results, metadata = self._recalculate_utilities(updated_results)
 
         baseline_result = self.baseline_result
-        if baseline_result is None or result.test_number == self.baseline_test_number:
+        if baseline_result is None or any(
+            result.test_number == self.baseline_test_number for result in new_results
+        ):
             baseline_result = next(
                 (item for item in recalculated_results if item.test_number == self.baseline_test_number),
                 None,
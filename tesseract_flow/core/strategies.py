@@ -1,9 +1,25 @@
 """Generation strategy protocol and registry."""
 from __future__ import annotations
 
+from functools import cache
+from importlib import import_module
+from types import ModuleType
 from typing import Any, Dict, Mapping, Protocol, runtime_checkable
 
-import litellm
+
+@cache
+def load_litellm() -> ModuleType:
+    """Import LiteLLM on first use; its import loads provider tables and the cost map."""
+
+    return import_module("litellm")
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``strategies.litellm`` resolvable (e.g. as a patch target) without an eager import.
+    if name == "litellm":
+        return load_litellm()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 @runtime_checkable
@@ -35,6 +51,7 @@ class StandardStrategy:
             parameters.update(config)
         temperature = parameters.pop("temperature", 0.0)
 
+        litellm = load_litellm()
         try:
             response = await litellm.acompletion(
                 model=model,
@@ -83,6 +100,7 @@ class ChainOfThoughtStrategy:
             f"{prompt}"
         )
 
+        litellm = load_litellm()
         try:
             response = await litellm.acompletion(
                 model=model,
@@ -136,6 +154,7 @@ class FewShotStrategy:
             messages.append({"role": "assistant", "content": example_output})
         messages.append({"role": "user", "content": prompt})
 
+        litellm = load_litellm()
         try:
             response = await litellm.acompletion(
                 model=model,
@@ -7,11 +7,11 @@ import logging
 import math
 import random
 import re
-from typing import Any, Dict, Iterable, Mapping, Optional
-
-import litellm
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 from tesseract_flow.core.exceptions import EvaluationError
+from tesseract_flow.core.strategies import load_litellm
 from tesseract_flow.core.types import RubricDimension
 
 from .cache import CacheBackend, build_cache_key
@@ -41,6 +41,7 @@ class RubricEvaluator:
             "scale": "0-100 where 0=not useful, 100=highly actionable",
         },
     }
+    DEFAULT_RUBRIC_DIMS: Tuple[str, ...] = tuple(DEFAULT_RUBRIC)
 
     def __init__(
         self,
@@ -194,7 +195,7 @@ class RubricEvaluator:
                 self._logger.debug(
                     "Rubric evaluation attempt %s/%s with model %s", attempt, self._max_retries, model
                 )
-                return await litellm.acompletion(
+                return await load_litellm().acompletion(
                     model=model,
                     messages=payload,
                     temperature=temperature,
@@ -404,12 +405,7 @@ class RubricEvaluator:
 
     def _extract_max_score(self, scale: str) -> float:
         """Extract maximum score from scale string like '0-100 points' or '1-10'."""
-        # Try to find a pattern like "X-Y" where Y is the max
-        match = re.search(r'(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)', scale)
-        if match:
-            return float(match.group(2))
-        # Default to 100 if we can't parse the scale
-        return 100.0
+        return _max_score_for_scale(scale)
 
     def _normalize_score(self, raw_score: Any, max_score: float = 100.0) -> float:
         try:
@@ -458,3 +454,26 @@ class RubricEvaluator:
             msg = "Temperature must be between 0.0 and 1.0."
             raise ValueError(msg)
         return float(value)
+
+
+# Matches a range like "X-Y" in a rubric scale description; Y is the max score.
+_SCALE_RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)")
+
+
+@lru_cache(maxsize=64)
+def _max_score_for_scale(scale: str) -> float:
+    """Parse the max score of a scale string once; rubrics reuse the same few scales."""
+
+    match = _SCALE_RANGE_PATTERN.search(scale)
+    if match:
+        return float(match.group(2))
+    # Default to 100 if we can't parse the scale
+    return 100.0
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``rubric.litellm`` resolvable (e.g. as a patch target) without an eager import.
+    if name == "litellm":
+        return load_litellm()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from time import perf_counter
@@ -280,7 +281,16 @@ class ExperimentExecutor:
         file_path = Path(path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         serialized = run.model_dump_json(indent=2, exclude_none=True)
-        file_path.write_text(serialized, encoding="utf-8")
+        # Runs are re-saved after every result; writing a sibling file and renaming it
+        # keeps the previous snapshot intact if the process dies mid-write. No fsync is
+        # issued, matching FileCacheBackend.
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+        try:
+            tmp_path.write_text(serialized, encoding="utf-8")
+            os.replace(tmp_path, file_path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                tmp_path.unlink()
         logger.debug("Persisted experiment run %s to %s", run.experiment_id, file_path)
         return file_path
 
@@ -289,8 +299,8 @@ class ExperimentExecutor:
         """Load an experiment run from a JSON file."""
 
         file_path = Path(path)
-        data = json.loads(file_path.read_text(encoding="utf-8"))
-        return ExperimentRun.model_validate(data)
+        # pydantic-core parses and validates the JSON bytes in one native pass.
+        return ExperimentRun.model_validate_json(file_path.read_bytes())
 
     def _ensure_running_state(self, run: ExperimentRun) -> ExperimentRun:
         if run.status == "COMPLETED":
@@ -1,18 +1,18 @@
 """Pareto frontier computation and visualization utilities."""
 from __future__ import annotations
 
+import sys
+from functools import cache
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
-import matplotlib
-
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from tesseract_flow.core.config import TestConfiguration, TestResult
 
+if TYPE_CHECKING:  # pragma: no cover - used for type checking only
+    from types import ModuleType
+
 
 _TOLERANCE = 1e-9
 
@@ -191,6 +191,7 @@ class ParetoFrontier(BaseModel):
         destination = _resolve_output_path(output_path)
         destination.parent.mkdir(parents=True, exist_ok=True)
 
+        plt = _load_pyplot()
         fig, ax = plt.subplots(figsize=(8, 6), dpi=120)
 
         sizes = _bubble_sizes([point.latency for point in self.points])
@@ -259,6 +260,24 @@ class ParetoFrontier(BaseModel):
         return destination
 
 
+@cache
+def _load_pyplot() -> "ModuleType":
+    """Import pyplot on first use so computing frontiers does not pull in matplotlib.
+
+    The headless ``Agg`` backend is selected once, and only when the caller has not
+    already imported pyplot with a backend of their own.
+    """
+
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def _axis_value(point: ParetoPoint, axis: str) -> float:
     if axis == "cost":
         return point.cost
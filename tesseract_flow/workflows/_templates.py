@@ -0,0 +1,25 @@
+"""Shared Jinja environment for workflow prompt templates."""
+from __future__ import annotations
+
+from typing import Dict, Mapping
+
+from jinja2 import DictLoader, Environment, Template
+
+_TEMPLATE_SOURCES: Dict[str, str] = {}
+
+ENVIRONMENT = Environment(loader=DictLoader(_TEMPLATE_SOURCES), auto_reload=False)
+
+
+def compile_prompts(namespace: str, prompts: Mapping[str, str]) -> Dict[str, Template]:
+    """Register ``prompts`` under ``namespace`` and return their compiled templates.
+
+    Templates are stored as ``"<namespace>/<name>"`` in the shared environment, which
+    compiles each source once and caches the result for the lifetime of the process.
+    """
+
+    compiled: Dict[str, Template] = {}
+    for name, source in prompts.items():
+        key = f"{namespace}/{name}"
+        _TEMPLATE_SOURCES[key] = source
+        compiled[name] = ENVIRONMENT.get_template(key)
+    return compiled
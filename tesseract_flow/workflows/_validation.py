@@ -0,0 +1,23 @@
+"""Shared field validation helpers for workflow models."""
+from __future__ import annotations
+
+from functools import partial
+
+from pydantic import AfterValidator
+
+
+def _strip_nonempty(value: str, *, label: str) -> str:
+    stripped = value.strip()
+    if not stripped:
+        msg = f"{label} must be non-empty."
+        raise ValueError(msg)
+    return stripped
+
+
+def nonempty_text(label: str) -> AfterValidator:
+    """Return a validator that strips whitespace and rejects empty strings.
+
+    ``label`` names the field in the validation error message.
+    """
+
+    return AfterValidator(partial(_strip_nonempty, label=label))
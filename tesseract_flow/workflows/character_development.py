@@ -1,7 +1,6 @@
 """Character development workflow built on LangGraph."""
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional
@@ -121,20 +120,7 @@ class CharacterDevelopmentWorkflow(BaseWorkflowService[CharacterDevelopmentInput
 
     def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
         strategy = get_strategy(runtime.strategy_name)
-        try:
-            return asyncio.run(strategy.generate(prompt, model=runtime.model, config={"temperature": runtime.temperature}))
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(strategy.generate(prompt, model=runtime.model, config={"temperature": runtime.temperature}))
-            finally:
-                loop.close()
-
-    def _coerce_float(self, value: Any, default: float) -> float:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
+        return self._await_coroutine(strategy.generate(prompt, model=runtime.model, config={"temperature": runtime.temperature}))
 
 
 __all__ = ["CharacterDevelopmentInput", "CharacterDevelopmentOutput", "CharacterDevelopmentWorkflow"]
@@ -4,8 +4,6 @@ Tests JSON vs. Markdown, strict vs. flexible schemas, and other structured outpu
 """
 from __future__ import annotations
 
-import asyncio
-
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -16,7 +14,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from tesseract_flow.core.base_workflow import BaseWorkflowService
 from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, WorkflowConfig
 from tesseract_flow.core.exceptions import WorkflowExecutionError
-from tesseract_flow.core.strategies import GenerationStrategy, get_strategy
+from tesseract_flow.core.strategies import get_strategy
 
 
 class CharacterProfileInput(BaseModel):
@@ -259,9 +257,6 @@ class CharacterProfileWorkflow(BaseWorkflowService[CharacterProfileInput, Charac
         runtime: _RuntimeSettings = state["settings"]
         input_model: CharacterProfileInput = state["input"]
 
-        # Get strategy
-        strategy: GenerationStrategy = get_strategy("standard")  # Always use standard for structured output
-
         # Build context for prompt
         context = {
             "character_name": input_model.character_name,
@@ -305,7 +300,7 @@ class CharacterProfileWorkflow(BaseWorkflowService[CharacterProfileInput, Charac
 
     def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
         """Invoke generation strategy synchronously."""
-        strategy = get_strategy("standard")
+        strategy = get_strategy("standard")  # Always use standard for structured output
         parameters = {"temperature": runtime.temperature}
         return self._await_coroutine(
             strategy.generate(
@@ -314,23 +309,3 @@ class CharacterProfileWorkflow(BaseWorkflowService[CharacterProfileInput, Charac
                 config=parameters,
             )
         )
-
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
@@ -1,7 +1,6 @@
 """Code review workflow built on LangGraph."""
 from __future__ import annotations
 
-import asyncio
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -433,16 +432,6 @@ class CodeReviewWorkflow(BaseWorkflowService[CodeReviewInput, CodeReviewOutput])
         except ValueError as exc:
             raise WorkflowExecutionError(f"Unknown generation strategy: {name}") from exc
 
-    def _await_coroutine(self, coroutine: Any) -> str:
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
     def _parse_analysis(self, response: str) -> Dict[str, Any]:
         cleaned = self._strip_code_fence(response)
         try:
@@ -608,12 +597,6 @@ class CodeReviewWorkflow(BaseWorkflowService[CodeReviewInput, CodeReviewOutput])
             return language.strip()
         return "python"
 
-    def _coerce_float(self, value: Any, default: float) -> float:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
-
 
 __all__ = [
     "CodeIssue",
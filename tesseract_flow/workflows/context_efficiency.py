@@ -5,7 +5,6 @@ to evaluate efficiency across its large context window.
 """
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -378,23 +377,3 @@ Provide a clear, complete answer."""
                 config=parameters,
             )
         )
-
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
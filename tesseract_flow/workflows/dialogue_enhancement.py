@@ -1,7 +1,6 @@
 """Dialogue enhancement workflow built on LangGraph."""
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional
@@ -294,16 +293,6 @@ class DialogueEnhancementWorkflow(BaseWorkflowService[DialogueEnhancementInput,
         except ValueError as exc:
             raise WorkflowExecutionError(f"Unknown generation strategy: {name}") from exc
 
-    def _await_coroutine(self, coroutine: Any) -> str:
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
     def _build_evaluation_text(self, dialogue: str) -> str:
         """Build evaluation text from enhanced dialogue."""
         return f"Enhanced Dialogue:\n{dialogue}"
@@ -336,12 +325,6 @@ class DialogueEnhancementWorkflow(BaseWorkflowService[DialogueEnhancementInput,
 """
             return default_dialogue.strip(), None
 
-    def _coerce_float(self, value: Any, default: float) -> float:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
-
 
 __all__ = [
     "DialogueEnhancementInput",
@@ -320,12 +320,6 @@ class FictionSceneWorkflow(BaseWorkflowService[FictionSceneInput, FictionSceneOu
         except (FileNotFoundError, OSError):
             return "Two old friends meet after years apart, each hiding a secret.", None
 
-    def _coerce_float(self, value: Any, default: float) -> float:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
-
     def _coerce_bool(self, value: Any, default: bool) -> bool:
         """Coerce a value to boolean, handling string 'true'/'false'."""
         if isinstance(value, bool):
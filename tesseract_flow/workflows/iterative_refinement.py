@@ -4,7 +4,6 @@ Tests how R1 refines and improves outputs through multiple revision cycles with
 """
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -321,23 +320,3 @@ Provide the improved version:"""
                 config=parameters,
             )
         )
-
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
@@ -5,66 +5,40 @@ entities from story text to build a knowledge base for AI-assisted writing.
 """
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, ClassVar, Dict, Mapping, Optional
 
 from jinja2 import Template
 from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from tesseract_flow.core.base_workflow import BaseWorkflowService
 from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, WorkflowConfig
 from tesseract_flow.core.strategies import GenerationStrategy, get_strategy
+from tesseract_flow.workflows._validation import nonempty_text
 
 
 class LoreExpansionInput(BaseModel):
     """Input payload for lore expansion."""
 
-    source_text: str = Field(..., min_length=1)
+    source_text: Annotated[str, nonempty_text("Source text")] = Field(..., min_length=1)
     story_context: Optional[str] = None
     expansion_focus: Optional[str] = "comprehensive"  # comprehensive or targeted
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    model_config = ConfigDict(extra="allow")
-
-    @field_validator("source_text")
-    @classmethod
-    def _strip_text(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Source text must be a non-empty string."
-            raise ValueError(msg)
-        return stripped
+    model_config = ConfigDict(extra="ignore")
 
 
 class LoreExpansionOutput(BaseModel):
     """Workflow output containing extracted lorebook entities."""
 
-    extracted_content: str
-    evaluation_text: str
+    extracted_content: Annotated[str, nonempty_text("Extracted content")]
+    evaluation_text: Annotated[str, nonempty_text("Evaluation text")]
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
     model_config = ConfigDict(validate_assignment=True)
 
-    @field_validator("extracted_content")
-    @classmethod
-    def _normalize_content(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Extracted content must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
-    @field_validator("evaluation_text")
-    @classmethod
-    def _normalize_evaluation(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Evaluation text must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
     def render_for_evaluation(self) -> str:
         """Return textual representation used for rubric evaluation."""
         return self.evaluation_text
@@ -75,11 +49,13 @@ class _RuntimeSettings:
     model: str
     temperature: float
     generation_strategy: str
+    strategy: GenerationStrategy
     expansion_type: str
     context_inclusion: str
     output_structure: str
     entity_detection: str
     relationship_depth: str
+    cache_responses: bool
     metadata: Dict[str, Any]
 
 
@@ -90,31 +66,33 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
     elements from story text, similar to storypunk-app's lore expansion system.
     """
 
-    DEFAULT_PROMPTS: Dict[str, str] = {
-        "extract": (
-            "You are an expert at analyzing fiction and extracting structured worldbuilding information.\n"
-            "\n"
-            "Analyze the following story text and extract lorebook entities:\n"
-            "\n"
-            "{{source_text}}\n"
-            "\n"
-            "{% if story_context %}Story Context: {{story_context}}\n{% endif %}"
-            "\n"
-            "Extract the following types of entities:\n"
-            "- **Characters**: Names, roles, key traits, relationships\n"
-            "- **Locations**: Places, settings, atmosphere, significance\n"
-            "- **Worldbuilding**: Rules, magic systems, technology, culture\n"
-            "- **Themes**: Central ideas, motifs, symbols\n"
-            "\n"
-            "Focus on: {{expansion_focus}} expansion\n"
-            "Output format: {{output_structure}}\n"
-            "Entity detection approach: {{entity_detection}}\n"
-            "Relationship detail level: {{relationship_depth}}\n"
-            "\n"
-            "Provide complete, accurate, and consistent information extracted directly from the text.\n"
-            "Do not hallucinate details not present in the source material.\n"
-        ),
-    }
+    DEFAULT_PROMPTS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "extract": (
+                "You are an expert at analyzing fiction and extracting structured worldbuilding information.\n"
+                "\n"
+                "Analyze the following story text and extract lorebook entities:\n"
+                "\n"
+                "{{source_text}}\n"
+                "\n"
+                "{% if story_context %}Story Context: {{story_context}}\n{% endif %}"
+                "\n"
+                "Extract the following types of entities:\n"
+                "- **Characters**: Names, roles, key traits, relationships\n"
+                "- **Locations**: Places, settings, atmosphere, significance\n"
+                "- **Worldbuilding**: Rules, magic systems, technology, culture\n"
+                "- **Themes**: Central ideas, motifs, symbols\n"
+                "\n"
+                "Focus on: {{expansion_focus}} expansion\n"
+                "Output format: {{output_structure}}\n"
+                "Entity detection approach: {{entity_detection}}\n"
+                "Relationship detail level: {{relationship_depth}}\n"
+                "\n"
+                "Provide complete, accurate, and consistent information extracted directly from the text.\n"
+                "Do not hallucinate details not present in the source material.\n"
+            ),
+        }
+    )
 
     def __init__(
         self,
@@ -136,7 +114,7 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
         experiment_config: ExperimentConfig | None,
     ) -> LoreExpansionInput:
         """Prepare workflow input based on test configuration."""
-        values = {str(key): value for key, value in test_config.config_values.items()}
+        values = test_config.config_values
         temperature = self._coerce_float(values.get("temperature"), self._default_temperature)
         model_name = str(values.get("model", self._default_model))
         generation_strategy = str(values.get("generation_strategy", "standard"))
@@ -151,24 +129,28 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
         # Load sample text from config or use default
         sample_text = self._load_sample_text(workflow_config)
 
+        # Both metadata views are read-only downstream, so they share one copy.
+        config_values = dict(values)
         metadata = {
             "test_number": test_config.test_number,
-            "config_values": dict(values),
+            "config_values": config_values,
         }
         runtime_metadata = {
             "test_number": test_config.test_number,
-            "config": dict(values),
+            "config": config_values,
         }
 
         self._runtime = _RuntimeSettings(
             model=model_name,
             temperature=temperature,
             generation_strategy=generation_strategy,
+            strategy=get_strategy(generation_strategy),
             expansion_type=expansion_type,
             context_inclusion=context_inclusion,
             output_structure=output_structure,
             entity_detection=entity_detection,
             relationship_depth=relationship_depth,
+            cache_responses=self._response_cache_enabled(workflow_config) and temperature == 0.0,
             metadata=runtime_metadata,
         )
         self._extracted_content = None
@@ -203,11 +185,13 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
             model=self._default_model,
             temperature=self._default_temperature,
             generation_strategy="standard",
+            strategy=get_strategy("standard"),
             expansion_type="comprehensive",
             context_inclusion="scene_only",
             output_structure="json",
             entity_detection="explicit_prompt",
             relationship_depth="basic",
+            cache_responses=False,
             metadata={},
         )
         input_model = LoreExpansionInput.model_validate(payload)
@@ -223,9 +207,6 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
         runtime: _RuntimeSettings = state["settings"]
         input_model: LoreExpansionInput = state["input"]
 
-        # Get strategy
-        strategy: GenerationStrategy = get_strategy(runtime.generation_strategy)
-
         # Build context for prompt
         context = {
             "source_text": input_model.source_text,
@@ -255,7 +236,14 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
         extracted_content: str = state.get("extracted_content") or "No content extracted."
         input_model: LoreExpansionInput = state["input"]
 
-        evaluation_text = f"Source Text:\n{input_model.source_text}\n\nExtracted Lorebook:\n{extracted_content}"
+        evaluation_text = "".join(
+            (
+                "Source Text:\n",
+                input_model.source_text,
+                "\n\nExtracted Lorebook:\n",
+                extracted_content,
+            )
+        )
 
         return LoreExpansionOutput(
             extracted_content=extracted_content,
@@ -265,46 +253,25 @@ class LoreExpansionWorkflow(BaseWorkflowService[LoreExpansionInput, LoreExpansio
 
     def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
         """Invoke generation strategy synchronously."""
-        strategy = get_strategy(runtime.generation_strategy)
         parameters = {"temperature": runtime.temperature}
-        return self._await_coroutine(
-            strategy.generate(
-                prompt,
-                model=runtime.model,
-                config=parameters,
-            )
+        return self._generate_cached(
+            runtime.strategy,
+            prompt,
+            strategy_name=runtime.generation_strategy,
+            model=runtime.model,
+            config=parameters,
+            use_cache=runtime.cache_responses,
         )
 
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
-
     def _load_sample_text(self, workflow_config: Optional[WorkflowConfig]) -> str:
         """Load sample text from config or use default."""
         # For now, always use default sample text
         # In the future, we could load from workflow_config.sample_code_path if needed
-        return _get_default_sample_text()
+        return _DEFAULT_SAMPLE_TEXT
 
 
-def _get_default_sample_text() -> str:
-    """Return default sample fiction text for testing."""
-    return """The tavern fell silent as the cloaked figure entered. Elara recognized the silver clasp immediately—the mark of the Shadow Council. She gripped her dagger beneath the table, mind racing. If they'd found her here in Ravenport, her cover was blown.
+# Default sample fiction text used when no source text is configured.
+_DEFAULT_SAMPLE_TEXT = """The tavern fell silent as the cloaked figure entered. Elara recognized the silver clasp immediately—the mark of the Shadow Council. She gripped her dagger beneath the table, mind racing. If they'd found her here in Ravenport, her cover was blown.
 
 The stranger's eyes swept the room, lingering on each patron before settling on the innkeeper. "I seek passage to the Shattered Isles," they said, voice low and urgent. "The old routes through Darkwater Marsh are no longer safe."
 
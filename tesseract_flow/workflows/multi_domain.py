@@ -5,68 +5,41 @@ different task types (creative writing vs. data extraction).
 """
 from __future__ import annotations
 
-import asyncio
-
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, ClassVar, Dict, Mapping, Optional
 
 from jinja2 import Template
 from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from tesseract_flow.core.base_workflow import BaseWorkflowService
 from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, WorkflowConfig
 from tesseract_flow.core.exceptions import WorkflowExecutionError
 from tesseract_flow.core.strategies import GenerationStrategy, get_strategy
+from tesseract_flow.workflows._validation import nonempty_text
 
 
 class MultiDomainTaskInput(BaseModel):
     """Input payload for multi-domain task."""
 
     task_domain: str = Field(..., pattern="^(creative_writing|data_extraction)$")
-    task_description: str = Field(..., min_length=1)
+    task_description: Annotated[str, nonempty_text("Task description")] = Field(..., min_length=1)
     source_content: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    model_config = ConfigDict(extra="allow")
-
-    @field_validator("task_description")
-    @classmethod
-    def _strip_description(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Task description must be non-empty."
-            raise ValueError(msg)
-        return stripped
+    model_config = ConfigDict(extra="ignore")
 
 
 class MultiDomainTaskOutput(BaseModel):
     """Workflow output containing task result."""
 
-    task_output: str
-    evaluation_text: str
+    task_output: Annotated[str, nonempty_text("Task output")]
+    evaluation_text: Annotated[str, nonempty_text("Evaluation text")]
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
     model_config = ConfigDict(validate_assignment=True)
 
-    @field_validator("task_output")
-    @classmethod
-    def _normalize_output(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Task output must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
-    @field_validator("evaluation_text")
-    @classmethod
-    def _normalize_evaluation(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Evaluation text must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
     def render_for_evaluation(self) -> str:
         """Return textual representation used for rubric evaluation."""
         return self.evaluation_text
@@ -82,6 +55,8 @@ class _RuntimeSettings:
     top_p: float
     presence_penalty: float
     frequency_penalty: float
+    strategy: GenerationStrategy
+    cache_responses: bool
     metadata: Dict[str, Any]
 
 
@@ -92,44 +67,46 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
     in different types of tasks (creative writing vs. structured data extraction).
     """
 
-    DEFAULT_PROMPTS: Dict[str, str] = {
-        "creative_writing": (
-            "You are a creative fiction writer.\n"
-            "\n"
-            "Task: {{task_description}}\n"
-            "{% if source_content %}Context: {{source_content}}\n{% endif %}"
-            "\n"
-            "Target length: {{output_length}}\n"
-            "\n"
-            "Write compelling, original prose that engages the reader. Focus on:\n"
-            "- Vivid imagery and sensory details\n"
-            "- Natural dialogue and character voice\n"
-            "- Emotional resonance\n"
-            "- Unexpected but coherent story beats\n"
-            "\n"
-            "Begin writing:\n"
-        ),
-        "data_extraction": (
-            "You are a precise data extraction specialist.\n"
-            "\n"
-            "Task: {{task_description}}\n"
-            "{% if source_content %}Source Material:\n{{source_content}}\n{% endif %}"
-            "\n"
-            "Extract the requested information accurately and completely. Focus on:\n"
-            "- Precision and factual accuracy\n"
-            "- Complete coverage of requested data points\n"
-            "- Structured, organized output\n"
-            "- No hallucination or speculation\n"
-            "\n"
-            "{% if output_length == 'short' %}"
-            "Provide a concise extraction (2-3 key points).\n"
-            "{% else %}"
-            "Provide a comprehensive extraction with all relevant details.\n"
-            "{% endif %}"
-            "\n"
-            "Extract the data now:\n"
-        ),
-    }
+    DEFAULT_PROMPTS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "creative_writing": (
+                "You are a creative fiction writer.\n"
+                "\n"
+                "Task: {{task_description}}\n"
+                "{% if source_content %}Context: {{source_content}}\n{% endif %}"
+                "\n"
+                "Target length: {{output_length}}\n"
+                "\n"
+                "Write compelling, original prose that engages the reader. Focus on:\n"
+                "- Vivid imagery and sensory details\n"
+                "- Natural dialogue and character voice\n"
+                "- Emotional resonance\n"
+                "- Unexpected but coherent story beats\n"
+                "\n"
+                "Begin writing:\n"
+            ),
+            "data_extraction": (
+                "You are a precise data extraction specialist.\n"
+                "\n"
+                "Task: {{task_description}}\n"
+                "{% if source_content %}Source Material:\n{{source_content}}\n{% endif %}"
+                "\n"
+                "Extract the requested information accurately and completely. Focus on:\n"
+                "- Precision and factual accuracy\n"
+                "- Complete coverage of requested data points\n"
+                "- Structured, organized output\n"
+                "- No hallucination or speculation\n"
+                "\n"
+                "{% if output_length == 'short' %}"
+                "Provide a concise extraction (2-3 key points).\n"
+                "{% else %}"
+                "Provide a comprehensive extraction with all relevant details.\n"
+                "{% endif %}"
+                "\n"
+                "Extract the data now:\n"
+            ),
+        }
+    )
 
     def __init__(
         self,
@@ -149,7 +126,7 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
         experiment_config: ExperimentConfig | None,
     ) -> MultiDomainTaskInput:
         """Prepare workflow input based on test configuration."""
-        values = {str(key): value for key, value in test_config.config_values.items()}
+        values = test_config.config_values
         temperature = self._coerce_float(values.get("temperature"), self._default_temperature)
         model_name = str(values.get("model", self._default_model))
         task_domain = str(values.get("task_domain", "creative_writing"))
@@ -159,13 +136,17 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
         presence_penalty = self._coerce_float(values.get("presence_penalty"), 0.0)
         frequency_penalty = self._coerce_float(values.get("frequency_penalty"), 0.0)
 
+        workflow_config = experiment_config.workflow_config if experiment_config else self.config
+
+        # Both metadata views are read-only downstream, so they share one copy.
+        config_values = dict(values)
         metadata = {
             "test_number": test_config.test_number,
-            "config_values": dict(values),
+            "config_values": config_values,
         }
         runtime_metadata = {
             "test_number": test_config.test_number,
-            "config": dict(values),
+            "config": config_values,
         }
 
         self._runtime = _RuntimeSettings(
@@ -177,6 +158,8 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
             top_p=top_p,
             presence_penalty=presence_penalty,
             frequency_penalty=frequency_penalty,
+            strategy=get_strategy("standard"),
+            cache_responses=self._response_cache_enabled(workflow_config) and temperature == 0.0,
             metadata=runtime_metadata,
         )
 
@@ -219,6 +202,8 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
             top_p=0.9,
             presence_penalty=0.0,
             frequency_penalty=0.0,
+            strategy=get_strategy("standard"),
+            cache_responses=False,
             metadata={},
         )
         input_model = MultiDomainTaskInput.model_validate(payload)
@@ -234,9 +219,6 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
         runtime: _RuntimeSettings = state["settings"]
         input_model: MultiDomainTaskInput = state["input"]
 
-        # Get strategy
-        strategy: GenerationStrategy = get_strategy("standard")
-
         # Select prompt based on domain
         prompt_key = runtime.task_domain
         template = Template(self.DEFAULT_PROMPTS[prompt_key])
@@ -282,7 +264,6 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
 
     def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
         """Invoke generation strategy synchronously."""
-        strategy = get_strategy("standard")
         # Build config with all sampling parameters
         parameters = {"temperature": runtime.temperature}
         if runtime.top_p > 0:
@@ -292,30 +273,11 @@ class MultiDomainTaskWorkflow(BaseWorkflowService[MultiDomainTaskInput, MultiDom
         if runtime.frequency_penalty > 0:
             parameters["frequency_penalty"] = runtime.frequency_penalty
 
-        return self._await_coroutine(
-            strategy.generate(
-                prompt,
-                model=runtime.model,
-                config=parameters,
-            )
+        return self._generate_cached(
+            runtime.strategy,
+            prompt,
+            strategy_name="standard",
+            model=runtime.model,
+            config=parameters,
+            use_cache=runtime.cache_responses,
         )
-
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
@@ -5,10 +5,10 @@ work better for analytical tasks vs. creative tasks.
 """
 from __future__ import annotations
 
-import asyncio
-
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Sequence
 
 from jinja2 import Template
 from langgraph.graph import END, StateGraph
@@ -18,6 +18,7 @@ from tesseract_flow.core.base_workflow import BaseWorkflowService
 from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, WorkflowConfig
 from tesseract_flow.core.exceptions import WorkflowExecutionError
 from tesseract_flow.core.strategies import GenerationStrategy, get_strategy
+from tesseract_flow.workflows._templates import compile_prompts
 
 
 class MultiTaskBenchmarkInput(BaseModel):
@@ -49,38 +50,23 @@ class MultiTaskBenchmarkOutput(BaseModel):
 
     model_config = ConfigDict(validate_assignment=True)
 
-    @field_validator("task_result")
-    @classmethod
-    def _normalize_result(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Task result must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
-    @field_validator("evaluation_text")
-    @classmethod
-    def _normalize_evaluation(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Evaluation text must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
     def render_for_evaluation(self) -> str:
         """Return textual representation used for rubric evaluation."""
         return self.evaluation_text
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _RuntimeSettings:
     model: str
     temperature: float
     generation_strategy: str
+    strategy: GenerationStrategy
     task_type: str
     example_count: int
     reasoning_visibility: str
     output_format: str
+    prompt_skeleton: str
+    cache_responses: bool
     metadata: Dict[str, Any]
 
 
@@ -135,6 +121,17 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
         ),
     }
 
+    _COMPILED_PROMPTS: ClassVar[Dict[str, Template]] = compile_prompts(
+        "multi_task_benchmark", DEFAULT_PROMPTS
+    )
+
+    _TASK_DESCRIPTIONS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "analytical": "Analyze the following argument for logical fallacies: 'Studies show that 80% of successful entrepreneurs wake up before 6am. Therefore, if you want to be successful, you must wake up before 6am.'",
+            "creative": "Write a short paragraph describing a futuristic city where nature and technology have merged seamlessly. Focus on sensory details and atmosphere.",
+        }
+    )
+
     def __init__(
         self,
         *,
@@ -153,7 +150,7 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
         experiment_config: ExperimentConfig | None,
     ) -> MultiTaskBenchmarkInput:
         """Prepare workflow input based on test configuration."""
-        values = {str(key): value for key, value in test_config.config_values.items()}
+        values = test_config.config_values
         temperature = self._coerce_float(values.get("temperature"), self._default_temperature)
         model_name = str(values.get("model", self._default_model))
         generation_strategy = str(values.get("generation_strategy", "standard"))
@@ -162,32 +159,58 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
         reasoning_visibility = str(values.get("reasoning_visibility", "silent_thinking"))
         output_format = str(values.get("output_format", "freeform"))
 
+        # Select task based on task type; anything other than analytical is creative
+        task_description = self._TASK_DESCRIPTIONS.get(
+            task_type, self._TASK_DESCRIPTIONS["creative"]
+        )
+
+        # Both metadata views are read-only downstream, so they share one copy.
+        config_values = dict(values)
         metadata = {
             "test_number": test_config.test_number,
-            "config_values": dict(values),
+            "config_values": config_values,
         }
         runtime_metadata = {
             "test_number": test_config.test_number,
-            "config": dict(values),
+            "config": config_values,
         }
 
+        # Optionally route low-complexity configurations to a cheaper model.
+        workflow_config = experiment_config.workflow_config if experiment_config else self.config
+        routing_model = self._config_extras(workflow_config).get("complexity_routing_model")
+        if routing_model:
+            complexity = _complexity_score(
+                task_type,
+                example_count,
+                reasoning_visibility,
+                output_format,
+                len(task_description),
+            )
+            if complexity < _ROUTING_THRESHOLD:
+                model_name = str(routing_model)
+            metadata["complexity_score"] = complexity
+            metadata["routed_model"] = model_name
+
         self._runtime = _RuntimeSettings(
             model=model_name,
             temperature=temperature,
             generation_strategy=generation_strategy,
+            strategy=get_strategy(generation_strategy),
             task_type=task_type,
             example_count=example_count,
             reasoning_visibility=reasoning_visibility,
             output_format=output_format,
+            prompt_skeleton=_compose_prompt(
+                self._execute_template(workflow_config),
+                task_type,
+                example_count,
+                reasoning_visibility,
+                output_format,
+            ),
+            cache_responses=self._response_cache_enabled(workflow_config) and temperature == 0.0,
             metadata=runtime_metadata,
         )
 
-        # Select task based on task type
-        if task_type == "analytical":
-            task_description = "Analyze the following argument for logical fallacies: 'Studies show that 80% of successful entrepreneurs wake up before 6am. Therefore, if you want to be successful, you must wake up before 6am.'"
-        else:  # creative
-            task_description = "Write a short paragraph describing a futuristic city where nature and technology have merged seamlessly. Focus on sensory details and atmosphere."
-
         return MultiTaskBenchmarkInput(
             task_description=task_description,
             task_type=task_type,
@@ -210,17 +233,29 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
         return graph
 
     def _initialize_state(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._state_for_input(MultiTaskBenchmarkInput.model_validate(payload))
+
+    def _state_for_input(self, input_model: MultiTaskBenchmarkInput) -> Dict[str, Any]:
+        """Build the initial state for an input that is already validated."""
         runtime = self._runtime or _RuntimeSettings(
             model=self._default_model,
             temperature=self._default_temperature,
             generation_strategy="standard",
+            strategy=get_strategy("standard"),
             task_type="analytical",
             example_count=0,
             reasoning_visibility="silent_thinking",
             output_format="freeform",
+            prompt_skeleton=_compose_prompt(
+                self._execute_template(self.config),
+                "analytical",
+                0,
+                "silent_thinking",
+                "freeform",
+            ),
+            cache_responses=False,
             metadata={},
         )
-        input_model = MultiTaskBenchmarkInput.model_validate(payload)
         return {
             "input": input_model,
             "settings": runtime,
@@ -233,21 +268,8 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
         runtime: _RuntimeSettings = state["settings"]
         input_model: MultiTaskBenchmarkInput = state["input"]
 
-        # Get strategy
-        strategy: GenerationStrategy = get_strategy(runtime.generation_strategy)
-
-        # Build context for prompt
-        context = {
-            "task_description": input_model.task_description,
-            "task_type": runtime.task_type,
-            "example_count": runtime.example_count,
-            "reasoning_visibility": runtime.reasoning_visibility,
-            "output_format": runtime.output_format,
-        }
-
         # Render prompt
-        template = Template(self.DEFAULT_PROMPTS["execute_task"])
-        prompt = template.render(**context)
+        prompt = self._build_prompt(runtime, input_model)
 
         # Generate
         task_result = self._invoke_strategy(prompt, runtime)
@@ -257,6 +279,17 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
         })
         return state
 
+    def _execute_template(self, workflow_config: WorkflowConfig | Mapping[str, Any]) -> str:
+        """Return the execute_task template source, preferring a ``prompts`` override."""
+        prompts = self._config_extras(workflow_config).get("prompts")
+        if isinstance(prompts, Mapping) and prompts.get("execute_task"):
+            return str(prompts["execute_task"])
+        return self.DEFAULT_PROMPTS["execute_task"]
+
+    def _build_prompt(self, runtime: _RuntimeSettings, input_model: MultiTaskBenchmarkInput) -> str:
+        """Fill the task description into the prompt prepared for these settings."""
+        return runtime.prompt_skeleton.replace(_TASK_PLACEHOLDER, input_model.task_description)
+
     def _finalize_output(self, state: Dict[str, Any]) -> MultiTaskBenchmarkOutput:
         task_result: str = state.get("task_result") or "No result generated."
         input_model: MultiTaskBenchmarkInput = state["input"]
@@ -270,37 +303,106 @@ class MultiTaskBenchmarkWorkflow(BaseWorkflowService[MultiTaskBenchmarkInput, Mu
             metadata=input_model.metadata,
         )
 
+    def _linear_steps(self) -> Sequence[Callable[[Any], Any]]:
+        return (self._initialize_state, self._execute_task, self._finalize_output)
+
     def _validate_output(self, result: Any) -> MultiTaskBenchmarkOutput:
         return MultiTaskBenchmarkOutput.model_validate(result)
 
+    def _prepare_async_run(
+        self,
+        test_config: TestConfiguration,
+        experiment_config: ExperimentConfig | None,
+    ) -> Dict[str, Any]:
+        input_model = self.prepare_input(test_config, experiment_config)
+        return self._state_for_input(input_model)
+
+    def _predict_output_tokens(self, state: Dict[str, Any]) -> int:
+        runtime: _RuntimeSettings = state["settings"]
+        tokens = 150
+        if runtime.reasoning_visibility == "explicit_chain":
+            tokens += 400
+        if runtime.output_format == "structured":
+            tokens += 250
+        return tokens
+
+    async def _arun_prepared(self, state: Dict[str, Any]) -> MultiTaskBenchmarkOutput:
+        runtime: _RuntimeSettings = state["settings"]
+        prompt = self._build_prompt(runtime, state["input"])
+        state["task_result"] = await self._ainvoke_strategy(prompt, runtime)
+        return self._finalize_output(state)
+
     def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
         """Invoke generation strategy synchronously."""
-        strategy = get_strategy(runtime.generation_strategy)
+        return self._await_coroutine(self._ainvoke_strategy(prompt, runtime))
+
+    async def _ainvoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
+        """Invoke generation strategy on the running event loop."""
         parameters = {"temperature": runtime.temperature}
-        return self._await_coroutine(
-            strategy.generate(
-                prompt,
-                model=runtime.model,
-                config=parameters,
-            )
+        return await self._agenerate_cached(
+            runtime.strategy,
+            prompt,
+            strategy_name=runtime.generation_strategy,
+            model=runtime.model,
+            config=parameters,
+            use_cache=runtime.cache_responses,
         )
 
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
+
+_TASK_PLACEHOLDER = "{task_description}"
+
+# Configurations scoring below this are sent to ``complexity_routing_model`` when set.
+_ROUTING_THRESHOLD = 3.0
+
+
+@lru_cache(maxsize=256)
+def _compose_prompt(
+    template_source: str,
+    task_type: str,
+    example_count: int,
+    reasoning_visibility: str,
+    output_format: str,
+) -> str:
+    """Render the execute_task prompt for one template and settings combination.
+
+    The task description is left as a placeholder so each combination is rendered by
+    Jinja once and later calls only substitute the description. The cache is keyed on
+    the template source, so a ``prompts`` override gets its own entries.
+    """
+
+    if template_source == MultiTaskBenchmarkWorkflow.DEFAULT_PROMPTS["execute_task"]:
+        template = MultiTaskBenchmarkWorkflow._COMPILED_PROMPTS["execute_task"]
+    else:
+        template = Template(template_source)
+    return template.render(
+        task_description=_TASK_PLACEHOLDER,
+        task_type=task_type,
+        example_count=example_count,
+        reasoning_visibility=reasoning_visibility,
+        output_format=output_format,
+    )
+
+
+def _complexity_score(
+    task_type: str,
+    example_count: int,
+    reasoning_visibility: str,
+    output_format: str,
+    description_length: int,
+) -> float:
+    """Estimate how demanding a configuration is on a 0-10 scale.
+
+    Few-shot examples weigh 25%, explicit reasoning 20%, structured output 20%,
+    creative tasks 15% and the task description length (saturating at 200
+    characters) 20%.
+    """
+
+    score = 2.5 * min(max(example_count, 0), 2) / 2
+    if reasoning_visibility == "explicit_chain":
+        score += 2.0
+    if output_format == "structured":
+        score += 2.0
+    if task_type == "creative":
+        score += 1.5
+    score += 2.0 * min(description_length / 200, 1.0)
+    return round(score, 2)
@@ -1,9 +1,9 @@
 """Progressive discovery workflow built on LangGraph."""
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, Optional, Sequence
 
 from jinja2 import Template
 from langgraph.graph import END, StateGraph
@@ -11,7 +11,8 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from tesseract_flow.core.base_workflow import BaseWorkflowService
 from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, WorkflowConfig
-from tesseract_flow.core.strategies import get_strategy
+from tesseract_flow.core.strategies import GenerationStrategy, get_strategy
+from tesseract_flow.workflows._templates import compile_prompts
 
 
 class ProgressiveDiscoveryInput(BaseModel):
@@ -34,13 +35,15 @@ class ProgressiveDiscoveryOutput(BaseModel):
         return self.evaluation_text
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _RuntimeSettings:
     model: str
     temperature: float
     context_strategy: str
     discovery_trigger: str
     strategy_name: str
+    strategy: GenerationStrategy
+    cache_responses: bool
     metadata: Dict[str, Any]
 
 
@@ -63,6 +66,10 @@ class ProgressiveDiscoveryWorkflow(BaseWorkflowService[ProgressiveDiscoveryInput
         ),
     }
 
+    _COMPILED_PROMPTS: ClassVar[Dict[str, Template]] = compile_prompts(
+        "progressive_discovery", DEFAULT_PROMPTS
+    )
+
     def __init__(self, *, config: Optional[WorkflowConfig] = None, default_model: str = "openrouter/deepseek/deepseek-chat", default_temperature: float = 0.6) -> None:
         super().__init__(config=config)
         self._default_model = default_model
@@ -70,16 +77,22 @@ class ProgressiveDiscoveryWorkflow(BaseWorkflowService[ProgressiveDiscoveryInput
         self._runtime: Optional[_RuntimeSettings] = None
 
     def prepare_input(self, test_config: TestConfiguration, experiment_config: ExperimentConfig | None) -> ProgressiveDiscoveryInput:
-        values = {str(key): value for key, value in test_config.config_values.items()}
+        values = test_config.config_values
+        config_values = dict(values)
+        strategy_name = str(values.get("generation_strategy", "standard"))
+        temperature = self._coerce_float(values.get("temperature"), self._default_temperature)
+        workflow_config = experiment_config.workflow_config if experiment_config else self.config
         self._runtime = _RuntimeSettings(
             model=str(values.get("model", self._default_model)),
-            temperature=self._coerce_float(values.get("temperature"), self._default_temperature),
+            temperature=temperature,
             context_strategy=str(values.get("context_strategy", "full_upfront")),
             discovery_trigger=str(values.get("discovery_trigger", "model_decides")),
-            strategy_name=str(values.get("generation_strategy", "standard")),
-            metadata={"test_number": test_config.test_number, "config": dict(values)},
+            strategy_name=strategy_name,
+            strategy=get_strategy(strategy_name),
+            cache_responses=self._response_cache_enabled(workflow_config) and temperature == 0.0,
+            metadata={"test_number": test_config.test_number, "config": config_values},
         )
-        return ProgressiveDiscoveryInput(task_description="Summarize a complex story with minimal context", metadata={"test_number": test_config.test_number, "config_values": dict(values)})
+        return ProgressiveDiscoveryInput(task_description="Summarize a complex story with minimal context", metadata={"test_number": test_config.test_number, "config_values": config_values})
 
     def _build_workflow(self) -> StateGraph:
         graph: StateGraph = StateGraph(dict)
@@ -92,18 +105,21 @@ class ProgressiveDiscoveryWorkflow(BaseWorkflowService[ProgressiveDiscoveryInput
         graph.add_edge("finalize", END)
         return graph
 
+    def _linear_steps(self) -> Sequence[Callable[[Any], Any]]:
+        return (self._initialize_state, self._discover_content, self._finalize_output)
+
     def _validate_output(self, result: Any) -> ProgressiveDiscoveryOutput:
         return ProgressiveDiscoveryOutput.model_validate(result)
 
-    def _initialize_state(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        runtime = self._runtime or _RuntimeSettings(self._default_model, self._default_temperature, "full_upfront", "model_decides", "standard", {})
-        return {"input": ProgressiveDiscoveryInput.model_validate(payload), "settings": runtime, "discovered_content": "", "test_config": runtime.metadata}
+    def _initialize_state(self, payload: Dict[str, Any] | ProgressiveDiscoveryInput) -> Dict[str, Any]:
+        runtime = self._runtime or _RuntimeSettings(self._default_model, self._default_temperature, "full_upfront", "model_decides", "standard", get_strategy("standard"), False, {})
+        input_model = payload if isinstance(payload, ProgressiveDiscoveryInput) else ProgressiveDiscoveryInput.model_validate(payload)
+        return {"input": input_model, "settings": runtime, "discovered_content": "", "test_config": runtime.metadata}
 
     def _discover_content(self, state: Dict[str, Any]) -> Dict[str, Any]:
         runtime: _RuntimeSettings = state["settings"]
         input_model: ProgressiveDiscoveryInput = state["input"]
-        prompt = self._render_prompt("discover", {"task_description": input_model.task_description, "context_strategy": runtime.context_strategy, "discovery_trigger": runtime.discovery_trigger})
-        discovered_content = self._invoke_strategy(prompt, runtime)
+        discovered_content = self._invoke_strategy(self._build_prompt(runtime, input_model), runtime)
         state.update({"discovered_content": discovered_content})
         return state
 
@@ -115,25 +131,33 @@ class ProgressiveDiscoveryWorkflow(BaseWorkflowService[ProgressiveDiscoveryInput
             metadata={"strategy": state["settings"].strategy_name, "model": state["settings"].model, "temperature": state["settings"].temperature, "context_strategy": state["settings"].context_strategy, "discovery_trigger": state["settings"].discovery_trigger},
         )
 
-    def _render_prompt(self, name: str, context: Mapping[str, Any]) -> str:
-        return Template(self.DEFAULT_PROMPTS[name]).render(**context).strip()
+    def _build_prompt(self, runtime: _RuntimeSettings, input_model: ProgressiveDiscoveryInput) -> str:
+        return _compose_prompt(runtime.context_strategy, runtime.discovery_trigger).replace(_TASK_PLACEHOLDER, input_model.task_description)
+
+    def _prepare_async_run(self, test_config: TestConfiguration, experiment_config: ExperimentConfig | None) -> Dict[str, Any]:
+        input_model = self.prepare_input(test_config, experiment_config)
+        return self._initialize_state(input_model)
+
+    async def _arun_prepared(self, state: Dict[str, Any]) -> ProgressiveDiscoveryOutput:
+        runtime: _RuntimeSettings = state["settings"]
+        state["discovered_content"] = await self._ainvoke_strategy(self._build_prompt(runtime, state["input"]), runtime)
+        return self._finalize_output(state)
+
+    async def _ainvoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
+        return await self._agenerate_cached(runtime.strategy, prompt, strategy_name=runtime.strategy_name, model=runtime.model, config={"temperature": runtime.temperature}, use_cache=runtime.cache_responses)
 
     def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings) -> str:
-        strategy = get_strategy(runtime.strategy_name)
-        try:
-            return asyncio.run(strategy.generate(prompt, model=runtime.model, config={"temperature": runtime.temperature}))
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(strategy.generate(prompt, model=runtime.model, config={"temperature": runtime.temperature}))
-            finally:
-                loop.close()
-
-    def _coerce_float(self, value: Any, default: float) -> float:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
+        return self._await_coroutine(self._ainvoke_strategy(prompt, runtime))
+
+
+_TASK_PLACEHOLDER = "{task_description}"
+
+
+@lru_cache(maxsize=64)
+def _compose_prompt(context_strategy: str, discovery_trigger: str) -> str:
+    """Render the discover prompt once per settings pair, leaving the task as a placeholder."""
+    context = {"task_description": _TASK_PLACEHOLDER, "context_strategy": context_strategy, "discovery_trigger": discovery_trigger}
+    return ProgressiveDiscoveryWorkflow._COMPILED_PROMPTS["discover"].render(**context).strip()
 
 
 __all__ = ["ProgressiveDiscoveryInput", "ProgressiveDiscoveryOutput", "ProgressiveDiscoveryWorkflow"]
@@ -5,13 +5,23 @@ different problem complexities, visibility preferences, and task types.
 """
 from __future__ import annotations
 
-import asyncio
-
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    get_args,
+)
 
-from jinja2 import Template
-from langgraph.graph import END, StateGraph
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from tesseract_flow.core.base_workflow import BaseWorkflowService
@@ -19,13 +29,22 @@ from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, Work
 from tesseract_flow.core.exceptions import WorkflowExecutionError
 from tesseract_flow.core.strategies import GenerationStrategy, get_strategy
 
+if TYPE_CHECKING:  # pragma: no cover - used for type checking only
+    from langgraph.graph import StateGraph
+
+_ProblemComplexity = Literal["simple", "complex"]
+_TaskType = Literal["analytical", "creative"]
+_PROBLEM_COMPLEXITIES: Tuple[_ProblemComplexity, ...] = get_args(_ProblemComplexity)
+_TASK_TYPES: Tuple[_TaskType, ...] = get_args(_TaskType)
+_Choice = TypeVar("_Choice", bound=str)
+
 
 class ReasoningTransparencyInput(BaseModel):
     """Input payload for reasoning transparency task."""
 
     problem_description: str = Field(..., min_length=1)
-    problem_complexity: str = Field(..., pattern="^(simple|complex)$")
-    task_type: str = Field(..., pattern="^(analytical|creative)$")
+    problem_complexity: _ProblemComplexity
+    task_type: _TaskType
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
     model_config = ConfigDict(extra="allow")
@@ -48,41 +67,12 @@ class ReasoningTransparencyOutput(BaseModel):
     evaluation_text: str
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    model_config = ConfigDict(validate_assignment=True)
-
-    @field_validator("reasoning_trace")
-    @classmethod
-    def _normalize_trace(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Reasoning trace must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
-    @field_validator("solution")
-    @classmethod
-    def _normalize_solution(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Solution must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
-    @field_validator("evaluation_text")
-    @classmethod
-    def _normalize_evaluation(cls, value: str) -> str:
-        stripped = value.strip()
-        if not stripped:
-            msg = "Evaluation text must be non-empty."
-            raise ValueError(msg)
-        return stripped
-
     def render_for_evaluation(self) -> str:
         """Return textual representation used for rubric evaluation."""
         return self.evaluation_text
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _RuntimeSettings:
     model: str
     temperature: float
@@ -92,7 +82,19 @@ class _RuntimeSettings:
     task_type: str
     max_reasoning_tokens: str
     verification_step: str
-    metadata: Dict[str, Any]
+    reasoning_parameters: Dict[str, Any]
+    strategy: GenerationStrategy
+
+
+_VERIFICATION_TEMPLATE = (
+    "Review this solution for correctness:\n"
+    "\n"
+    "Problem: {problem}\n"
+    "\n"
+    "Proposed solution: {solution}\n"
+    "\n"
+    "Is this solution correct? If there are errors, identify them briefly.\n"
+)
 
 
 class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInput, ReasoningTransparencyOutput]):
@@ -106,21 +108,21 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
         "native_r1_visible": (
             "Solve the following problem. Use your natural reasoning process and show your work.\\n"
             "\\n"
-            "Problem: {{problem_description}}\\n"
+            "Problem: {problem_description}\\n"
             "\\n"
             "Think through this step by step, then provide your final answer.\\n"
         ),
         "native_r1_hidden": (
             "Solve the following problem directly.\\n"
             "\\n"
-            "Problem: {{problem_description}}\\n"
+            "Problem: {problem_description}\\n"
             "\\n"
             "Provide your answer concisely.\\n"
         ),
         "prompted_cot_visible": (
             "Solve the following problem using Chain-of-Thought reasoning.\\n"
             "\\n"
-            "Problem: {{problem_description}}\\n"
+            "Problem: {problem_description}\\n"
             "\\n"
             "Let's solve this step by step:\\n"
             "1. First, identify what we know\\n"
@@ -132,13 +134,15 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
         "prompted_cot_hidden": (
             "Solve the following problem. Think carefully but provide only your final answer.\\n"
             "\\n"
-            "Problem: {{problem_description}}\\n"
+            "Problem: {problem_description}\\n"
             "\\n"
             "Answer:\\n"
         ),
     }
 
-    PROBLEMS: Dict[str, Dict[str, str]] = {
+    VERIFICATION_PROMPT: str = _VERIFICATION_TEMPLATE
+
+    PROBLEMS: ClassVar[Mapping[str, str]] = {
         "simple_analytical": "A train travels 120 km in 2 hours. What is its average speed in km/h?",
         "complex_analytical": (
             "Three friends split a restaurant bill. Alice pays 40% of the total, "
@@ -167,6 +171,9 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
         self._default_model = default_model
         self._default_temperature = default_temperature
         self._runtime: Optional[_RuntimeSettings] = None
+        self._runtime_metadata: Dict[str, Any] = {}
+        # Runtime settings hold no per-test state, so tests with the same settings share one.
+        self._runtime_cache: Dict[Tuple[Any, ...], _RuntimeSettings] = {}
 
     def prepare_input(
         self,
@@ -174,50 +181,62 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
         experiment_config: ExperimentConfig | None,
     ) -> ReasoningTransparencyInput:
         """Prepare workflow input based on test configuration."""
-        values = {str(key): value for key, value in test_config.config_values.items()}
+        values = test_config.config_values
         temperature = self._coerce_float(values.get("temperature"), self._default_temperature)
         model_name = str(values.get("model", self._default_model))
         reasoning_mode = str(values.get("reasoning_mode", "native_r1"))
-        problem_complexity = str(values.get("problem_complexity", "simple"))
+        problem_complexity = _narrow_choice(
+            values.get("problem_complexity", "simple"), _PROBLEM_COMPLEXITIES, "problem_complexity"
+        )
         reasoning_visibility = str(values.get("reasoning_visibility", "visible"))
-        task_type = str(values.get("task_type", "analytical"))
+        task_type = _narrow_choice(values.get("task_type", "analytical"), _TASK_TYPES, "task_type")
         max_reasoning_tokens = str(values.get("max_reasoning_tokens", "standard"))
         verification_step = str(values.get("verification_step", "none"))
 
+        # Both metadata views are read-only downstream, so they share one copy.
+        config_values = dict(values)
         metadata = {
             "test_number": test_config.test_number,
-            "config_values": dict(values),
+            "config_values": config_values,
         }
         runtime_metadata = {
             "test_number": test_config.test_number,
-            "config": dict(values),
+            "config": config_values,
         }
 
-        self._runtime = _RuntimeSettings(
-            model=model_name,
-            temperature=temperature,
-            reasoning_mode=reasoning_mode,
-            problem_complexity=problem_complexity,
-            reasoning_visibility=reasoning_visibility,
-            task_type=task_type,
-            max_reasoning_tokens=max_reasoning_tokens,
-            verification_step=verification_step,
-            metadata=runtime_metadata,
+        runtime_key = (
+            model_name,
+            temperature,
+            reasoning_mode,
+            problem_complexity,
+            reasoning_visibility,
+            task_type,
+            max_reasoning_tokens,
+            verification_step,
         )
+        runtime = self._runtime_cache.get(runtime_key)
+        if runtime is None:
+            runtime = _RuntimeSettings(
+                *runtime_key,
+                reasoning_parameters=_reasoning_parameters(model_name, reasoning_mode),
+                strategy=get_strategy("standard"),
+            )
+            self._runtime_cache[runtime_key] = runtime
+        self._runtime = runtime
+        self._runtime_metadata = runtime_metadata
 
         # Select problem based on complexity and task type
         problem_key = f"{problem_complexity}_{task_type}"
         problem_description = self.PROBLEMS.get(problem_key, self.PROBLEMS["simple_analytical"])
 
-        return ReasoningTransparencyInput(
-            problem_description=problem_description,
-            problem_complexity=problem_complexity,
-            task_type=task_type,
-            metadata=metadata,
-        )
+        canonical = _canonical_input(problem_description, problem_complexity, task_type)
+        return canonical.model_copy(update={"metadata": metadata})
 
     def _build_workflow(self) -> StateGraph:
         """Build LangGraph workflow."""
+        # Imported here so the default call-chain path never loads LangGraph.
+        from langgraph.graph import END, StateGraph
+
         graph = StateGraph(dict)
         graph.add_node("initialize", self._initialize_state)
         graph.add_node("solve", self._solve_problem)
@@ -232,7 +251,26 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
 
         return graph
 
+    def _linear_steps(self) -> Sequence[Callable[[Any], Any]]:
+        # prepare_input has already fixed the runtime, so a disabled verification step
+        # is dropped from the chain instead of being called as a no-op.
+        runtime = self._runtime
+        if runtime is None or runtime.verification_step == "none":
+            return (self._initialize_state, self._solve_problem, self._finalize_output)
+        return (
+            self._initialize_state,
+            self._solve_problem,
+            self._verify_solution,
+            self._finalize_output,
+        )
+
     def _initialize_state(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # run() passes the dump of an already validated input, so it is rehydrated
+        # without re-validation.
+        return self._state_for_input(ReasoningTransparencyInput.model_construct(**payload))
+
+    def _state_for_input(self, input_model: ReasoningTransparencyInput) -> Dict[str, Any]:
+        """Build the initial state for an input that is already validated."""
         runtime = self._runtime or _RuntimeSettings(
             model=self._default_model,
             temperature=self._default_temperature,
@@ -242,45 +280,45 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
             task_type="analytical",
             max_reasoning_tokens="standard",
             verification_step="none",
-            metadata={},
+            reasoning_parameters=_reasoning_parameters(self._default_model, "native_r1"),
+            strategy=get_strategy("standard"),
         )
-        input_model = ReasoningTransparencyInput.model_validate(payload)
         return {
             "input": input_model,
             "settings": runtime,
             "reasoning_trace": "",
             "solution": "",
-            "test_config": runtime.metadata,
+            "test_config": self._runtime_metadata,
         }
 
     def _solve_problem(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Solve the problem with configured reasoning mode."""
+        return self._await_coroutine(self._asolve_problem(state))
+
+    async def _asolve_problem(self, state: Dict[str, Any]) -> Dict[str, Any]:
         runtime: _RuntimeSettings = state["settings"]
         input_model: ReasoningTransparencyInput = state["input"]
 
         # Select prompt based on reasoning mode and visibility
         prompt_key = f"{runtime.reasoning_mode}_{runtime.reasoning_visibility}"
-        template = Template(self.DEFAULT_PROMPTS.get(prompt_key, self.DEFAULT_PROMPTS["native_r1_visible"]))
+        template = self.DEFAULT_PROMPTS.get(prompt_key, self.DEFAULT_PROMPTS["native_r1_visible"])
 
-        # Build context for prompt
-        context = {
-            "problem_description": input_model.problem_description,
-        }
-
-        # Render prompt
-        prompt = template.render(**context)
+        # Render prompt; the templates only substitute the problem description
+        prompt = template.format(problem_description=input_model.problem_description)
 
         # Generate with appropriate token limit
         max_tokens = 2000 if runtime.max_reasoning_tokens == "extended" else 1000
-        result = self._invoke_strategy(prompt, runtime, max_tokens=max_tokens)
+        result = await self._ainvoke_strategy(prompt, runtime, max_tokens=max_tokens)
 
         # Parse reasoning trace and solution
         if runtime.reasoning_visibility == "visible":
-            # Try to split reasoning from answer
-            if "Answer:" in result or "Final answer:" in result:
-                parts = result.split("Answer:" if "Answer:" in result else "Final answer:", 1)
-                reasoning_trace = parts[0].strip()
-                solution = parts[1].strip() if len(parts) > 1 else result
+            # Try to split reasoning from answer in a single scan per marker
+            before, marker, after = result.partition("Answer:")
+            if not marker:
+                before, marker, after = result.partition("Final answer:")
+            if marker:
+                reasoning_trace = before.strip()
+                solution = after.strip()
             else:
                 reasoning_trace = result
                 solution = result
@@ -288,14 +326,15 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
             reasoning_trace = "(reasoning hidden)"
             solution = result
 
-        state.update({
-            "reasoning_trace": reasoning_trace,
-            "solution": solution,
-        })
+        state["reasoning_trace"] = reasoning_trace
+        state["solution"] = solution
         return state
 
     def _verify_solution(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Optionally verify the solution."""
+        return self._await_coroutine(self._averify_solution(state))
+
+    async def _averify_solution(self, state: Dict[str, Any]) -> Dict[str, Any]:
         runtime: _RuntimeSettings = state["settings"]
 
         if runtime.verification_step == "none":
@@ -304,16 +343,12 @@ class ReasoningTransparencyWorkflow(BaseWorkflowService[ReasoningTransparencyInp
         input_model: ReasoningTransparencyInput = state["input"]
         solution: str = state["solution"]
 
-        verification_prompt = f"""Review this solution for correctness:
-
-Problem: {input_model.problem_description}
-
-Proposed solution: {solution}
-
-Is this solution correct? If there are errors, identify them briefly.
-"""
+        verification_prompt = self.VERIFICATION_PROMPT.format(
+            problem=input_model.problem_description,
+            solution=solution,
+        )
 
-        verification = self._invoke_strategy(verification_prompt, runtime, max_tokens=300)
+        verification = await self._ainvoke_strategy(verification_prompt, runtime, max_tokens=300)
 
         # Append verification to reasoning trace
         current_trace = state["reasoning_trace"]
@@ -322,22 +357,24 @@ Is this solution correct? If there are errors, identify them briefly.
         return state
 
     def _finalize_output(self, state: Dict[str, Any]) -> ReasoningTransparencyOutput:
-        reasoning_trace: str = state.get("reasoning_trace") or "(no reasoning trace)"
-        solution: str = state.get("solution") or "No solution generated."
+        # Outputs are only built here, so whitespace is normalized here rather than by
+        # field validators on the output model.
+        reasoning_trace: str = (state.get("reasoning_trace") or "").strip() or "(no reasoning trace)"
+        solution: str = (state.get("solution") or "").strip() or "No solution generated."
         input_model: ReasoningTransparencyInput = state["input"]
         runtime: _RuntimeSettings = state["settings"]
 
-        evaluation_text = (
-            f"Problem Complexity: {runtime.problem_complexity}\n"
-            f"Task Type: {runtime.task_type}\n"
-            f"Reasoning Mode: {runtime.reasoning_mode}\n"
-            f"Visibility: {runtime.reasoning_visibility}\n\n"
-            f"Problem: {input_model.problem_description}\n\n"
-            f"Reasoning:\n{reasoning_trace}\n\n"
-            f"Solution:\n{solution}"
+        evaluation_text = _EVALUATION_TEMPLATE.format(
+            problem_complexity=runtime.problem_complexity,
+            task_type=runtime.task_type,
+            reasoning_mode=runtime.reasoning_mode,
+            reasoning_visibility=runtime.reasoning_visibility,
+            problem_description=input_model.problem_description,
+            reasoning_trace=reasoning_trace,
+            solution=solution,
         )
 
-        return ReasoningTransparencyOutput(
+        return ReasoningTransparencyOutput.model_construct(
             reasoning_trace=reasoning_trace,
             solution=solution,
             evaluation_text=evaluation_text,
@@ -347,49 +384,87 @@ Is this solution correct? If there are errors, identify them briefly.
     def _validate_output(self, result: Any) -> ReasoningTransparencyOutput:
         return ReasoningTransparencyOutput.model_validate(result)
 
-    def _invoke_strategy(self, prompt: str, runtime: _RuntimeSettings, max_tokens: int = 1000) -> str:
-        """Invoke generation strategy synchronously."""
-        strategy = get_strategy("standard")
+    def _prepare_async_run(
+        self,
+        test_config: TestConfiguration,
+        experiment_config: ExperimentConfig | None,
+    ) -> Dict[str, Any]:
+        input_model = self.prepare_input(test_config, experiment_config)
+        return self._state_for_input(input_model)
+
+    def _predict_output_tokens(self, state: Dict[str, Any]) -> int:
+        runtime: _RuntimeSettings = state["settings"]
+        tokens = 2000 if runtime.max_reasoning_tokens == "extended" else 1000
+        if runtime.verification_step != "none":
+            tokens += 300
+        return tokens
+
+    async def _arun_prepared(self, state: Dict[str, Any]) -> ReasoningTransparencyOutput:
+        state = await self._asolve_problem(state)
+        if state["settings"].verification_step != "none":
+            state = await self._averify_solution(state)
+        return self._finalize_output(state)
+
+    async def _ainvoke_strategy(
+        self, prompt: str, runtime: _RuntimeSettings, max_tokens: int = 1000
+    ) -> str:
+        """Invoke generation strategy on the running event loop."""
         parameters = {
             "temperature": runtime.temperature,
             "max_tokens": max_tokens,
         }
-
-        # Add reasoning parameters based on model type and configuration
-        model_lower = runtime.model.lower()
-        reasoning_mode = runtime.reasoning_mode
-
-        if ("v3.2" in model_lower or "v3-2" in model_lower) and reasoning_mode == "native_r1":
-            # DeepSeek V3.2 uses reasoning.enabled boolean parameter
-            parameters["reasoning.enabled"] = True
-        elif "r1" in model_lower and reasoning_mode == "native_r1":
-            # DeepSeek R1 uses reasoning_mode parameter
-            parameters["reasoning_mode"] = "native_r1"
-
-        return self._await_coroutine(
-            strategy.generate(
-                prompt,
-                model=runtime.model,
-                config=parameters,
-            )
+        parameters.update(runtime.reasoning_parameters)
+        return await runtime.strategy.generate(
+            prompt,
+            model=runtime.model,
+            config=parameters,
         )
 
-    @staticmethod
-    def _await_coroutine(coroutine: Any) -> str:
-        """Execute async coroutine synchronously."""
-        try:
-            return asyncio.run(coroutine)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(coroutine)
-            finally:
-                loop.close()
-
-    @staticmethod
-    def _coerce_float(value: Any, default: float) -> float:
-        """Coerce value to float with fallback."""
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return default
+
+def _reasoning_parameters(model: str, reasoning_mode: str) -> Dict[str, Any]:
+    """Return the provider reasoning parameters for a model and reasoning mode."""
+
+    if reasoning_mode != "native_r1":
+        return {}
+    model_lower = model.lower()
+    if "v3.2" in model_lower or "v3-2" in model_lower:
+        # DeepSeek V3.2 uses reasoning.enabled boolean parameter
+        return {"reasoning.enabled": True}
+    if "r1" in model_lower:
+        # DeepSeek R1 uses reasoning_mode parameter
+        return {"reasoning_mode": "native_r1"}
+    return {}
+
+
+def _narrow_choice(value: Any, choices: Tuple[_Choice, ...], name: str) -> _Choice:
+    """Return the member of ``choices`` equal to the config value ``value``."""
+
+    for choice in choices:
+        if str(value) == choice:
+            return choice
+    msg = f"{name} must be one of {', '.join(choices)}; got {value!r}."
+    raise ValueError(msg)
+
+
+@lru_cache(maxsize=16)
+def _canonical_input(
+    problem_description: str, problem_complexity: _ProblemComplexity, task_type: _TaskType
+) -> ReasoningTransparencyInput:
+    """Validate one problem combination once; callers copy it with per-test metadata."""
+
+    return ReasoningTransparencyInput(
+        problem_description=problem_description,
+        problem_complexity=problem_complexity,
+        task_type=task_type,
+    )
+
+
+_EVALUATION_TEMPLATE = (
+    "Problem Complexity: {problem_complexity}\n"
+    "Task Type: {task_type}\n"
+    "Reasoning Mode: {reasoning_mode}\n"
+    "Visibility: {reasoning_visibility}\n\n"
+    "Problem: {problem_description}\n\n"
+    "Reasoning:\n{reasoning_trace}\n\n"
+    "Solution:\n{solution}"
+)
@@ -6,27 +6,68 @@ import inspect
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from tesseract_flow.core.config import Variable  # noqa: E402 - needs ROOT on sys.path
+
+_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _session_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by coroutine tests, creating it on first use."""
+
+    global _SESSION_LOOP
+    if _SESSION_LOOP is None or _SESSION_LOOP.is_closed():
+        _SESSION_LOOP = asyncio.new_event_loop()
+    return _SESSION_LOOP
+
 
 def pytest_configure(config) -> None:  # pragma: no cover - pytest hook
     config.addinivalue_line("markers", "asyncio: mark test as requiring asyncio event loop")
+    config.addinivalue_line("markers", "slow: real rendering or I/O; deselect with -m 'not slow'")
+    # Warm the package import chain once before collection; litellm itself loads on first use.
+    import tesseract_flow.evaluation.rubric  # noqa: F401
+    import tesseract_flow.experiments.executor  # noqa: F401
 
 
+# Fallback runner for coroutine tests when pytest-asyncio is not installed; with the
+# plugin, the session loop scope in pyproject.toml gives the same single shared loop.
 def pytest_pyfunc_call(pyfuncitem):  # pragma: no cover - pytest hook
     if asyncio.iscoroutinefunction(pyfuncitem.obj):
-        loop = asyncio.new_event_loop()
-        try:
-            signature = inspect.signature(pyfuncitem.obj)
-            kwargs = {
-                name: pyfuncitem.funcargs[name]
-                for name in signature.parameters
-                if name in pyfuncitem.funcargs
-            }
-            loop.run_until_complete(pyfuncitem.obj(**kwargs))
-        finally:
-            loop.close()
+        signature = inspect.signature(pyfuncitem.obj)
+        kwargs = {
+            name: pyfuncitem.funcargs[name]
+            for name in signature.parameters
+            if name in pyfuncitem.funcargs
+        }
+        _session_loop().run_until_complete(pyfuncitem.obj(**kwargs))
         return True
     return None
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:  # pragma: no cover - pytest hook
+    if _SESSION_LOOP is not None and not _SESSION_LOOP.is_closed():
+        _SESSION_LOOP.close()
+
+
+@pytest.fixture(scope="session")
+def variable_corpus() -> tuple[Variable, ...]:
+    """Build the standard four-variable corpus once per session (and per xdist worker)."""
+
+    return (
+        Variable(name="temperature", level_1=0.3, level_2=0.7),
+        Variable(name="model", level_1="gpt-4", level_2="claude"),
+        Variable(name="context", level_1="file", level_2="module"),
+        Variable(name="strategy", level_1="standard", level_2="cot"),
+    )
+
+
+@pytest.fixture
+def variables(variable_corpus: tuple[Variable, ...]) -> list[Variable]:
+    """Return a fresh list over the shared corpus so tests may extend or slice it."""
+
+    return list(variable_corpus)
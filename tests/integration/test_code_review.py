@@ -114,5 +114,5 @@ def test_code_review_workflow_generates_structured_feedback(
     assert metadata["context_size"] == "file_only"
     assert Path(metadata["sample_code_path"]) == sample_path
     assert workflow.last_run_metadata is not None
-    assert fake_strategy.calls[0]["config"]["temperature"] == pytest.approx(0.3)
+    assert fake_strategy.calls[0]["config"]["temperature"] == 0.3
     assert sample_code.strip() in fake_strategy.calls[0]["prompt"]
@@ -10,20 +10,32 @@ from tesseract_flow.core.exceptions import EvaluationError
 from tesseract_flow.core.types import RubricDimension
 from tesseract_flow.evaluation.rubric import RubricEvaluator
 
+_RESPONSE: Dict[str, Any] = {
+    "choices": [
+        {
+            "message": {
+                "content": json.dumps(
+                    {
+                        "clarity": {"score": "9", "reasoning": "Clear messaging."},
+                        "accuracy": {"score": 8, "reasoning": "Minor nitpicks."},
+                        "completeness": {"score": 7.5, "reasoning": "Covers most areas."},
+                        "usefulness": {"score": 10, "reasoning": "Extremely actionable."},
+                    }
+                )
+            }
+        }
+    ]
+}
+_CAPTURED_KEYS = frozenset({"model", "temperature", "response_format", "messages"})
+
 
 @pytest.mark.asyncio
 async def test_rubric_evaluator_parses_litellm_response(monkeypatch: pytest.MonkeyPatch) -> None:
     captured_kwargs: Dict[str, Any] = {}
 
     async def fake_acompletion(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-        captured_kwargs.update(kwargs)
-        payload = {
-            "clarity": {"score": "9", "reasoning": "Clear messaging."},
-            "accuracy": {"score": 8, "reasoning": "Minor nitpicks."},
-            "completeness": {"score": 7.5, "reasoning": "Covers most areas."},
-            "usefulness": {"score": 10, "reasoning": "Extremely actionable."},
-        }
-        return {"choices": [{"message": {"content": json.dumps(payload)}}]}
+        captured_kwargs.update({key: kwargs[key] for key in _CAPTURED_KEYS if key in kwargs})
+        return _RESPONSE
 
     monkeypatch.setattr(
         "tesseract_flow.evaluation.rubric.litellm.acompletion",
@@ -31,10 +43,8 @@ async def test_rubric_evaluator_parses_litellm_response(monkeypatch: pytest.Monk
     )
 
     custom_rubric: Dict[str, RubricDimension] = {
-        "clarity": RubricEvaluator.DEFAULT_RUBRIC["clarity"],
-        "accuracy": RubricEvaluator.DEFAULT_RUBRIC["accuracy"],
-        "completeness": RubricEvaluator.DEFAULT_RUBRIC["completeness"],
-        "usefulness": RubricEvaluator.DEFAULT_RUBRIC["usefulness"],
+        dimension: RubricEvaluator.DEFAULT_RUBRIC[dimension]
+        for dimension in RubricEvaluator.DEFAULT_RUBRIC_DIMS
     }
 
     evaluator = RubricEvaluator(model="test/model", temperature=0.4)
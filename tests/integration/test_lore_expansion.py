@@ -0,0 +1,61 @@
+"""Integration tests for the lore expansion workflow."""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from tesseract_flow.core.base_workflow import BaseWorkflowService
+from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, Variable
+from tesseract_flow.workflows.lore_expansion import LoreExpansionWorkflow
+
+
+class _FakeStrategy:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        config: Dict[str, Any] | None = None,
+    ) -> str:
+        self.calls.append({"prompt": prompt, "model": model, "config": dict(config or {})})
+        return '{"characters": [{"name": "Elara"}]}'
+
+
+def test_lore_expansion_reuses_cached_response_for_identical_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_strategy = _FakeStrategy()
+    monkeypatch.setattr(
+        "tesseract_flow.workflows.lore_expansion.get_strategy",
+        lambda name: fake_strategy,
+    )
+    BaseWorkflowService.clear_response_cache()
+
+    experiment_config = ExperimentConfig(
+        name="lore_expansion_experiment",
+        workflow="lore_expansion",
+        variables=[
+            Variable(name="temperature", level_1=0.0, level_2=0.7),
+            Variable(name="model", level_1="model/a", level_2="model/b"),
+            Variable(name="expansion_type", level_1="comprehensive", level_2="targeted"),
+            Variable(name="output_structure", level_1="json", level_2="markdown"),
+        ],
+        workflow_config={"response_cache_enabled": True},
+    )
+    test_config = TestConfiguration(
+        test_number=1,
+        config_values={"temperature": 0.0, "model": "model/a"},
+        workflow="lore_expansion",
+    )
+    workflow = LoreExpansionWorkflow()
+
+    first = workflow.run(workflow.prepare_input(test_config, experiment_config))
+    second = workflow.run(workflow.prepare_input(test_config, experiment_config))
+
+    assert first.extracted_content == second.extracted_content
+    assert len(fake_strategy.calls) == 1
+    BaseWorkflowService.clear_response_cache()
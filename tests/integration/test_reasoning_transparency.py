@@ -0,0 +1,92 @@
+"""Integration tests for the reasoning transparency workflow."""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from tesseract_flow.core.config import TestConfiguration, WorkflowConfig
+from tesseract_flow.workflows.reasoning_transparency import (
+    ReasoningTransparencyOutput,
+    ReasoningTransparencyWorkflow,
+)
+
+
+class _FakeStrategy:
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        config: Dict[str, Any] | None = None,
+    ) -> str:
+        self.calls.append({"prompt": prompt, "model": model, "config": dict(config or {})})
+        if prompt.startswith("Review this solution"):
+            return "The solution is correct."
+        return "Distance over time gives 120 / 2.\nAnswer: 60 km/h"
+
+
+@pytest.mark.parametrize("use_langgraph", [False, True], ids=["linear", "langgraph"])
+def test_reasoning_transparency_workflow_solves_and_verifies(
+    monkeypatch: pytest.MonkeyPatch, use_langgraph: bool
+) -> None:
+    fake_strategy = _FakeStrategy()
+    monkeypatch.setattr(
+        "tesseract_flow.workflows.reasoning_transparency.get_strategy",
+        lambda name: fake_strategy,
+    )
+    workflow = ReasoningTransparencyWorkflow(config=WorkflowConfig(use_langgraph=use_langgraph))
+
+    test_config = TestConfiguration(
+        test_number=1,
+        config_values={
+            "temperature": 0.2,
+            "model": "openrouter/deepseek/deepseek-r1",
+            "reasoning_mode": "native_r1",
+            "problem_complexity": "simple",
+            "reasoning_visibility": "visible",
+            "task_type": "analytical",
+            "max_reasoning_tokens": "extended",
+            "verification_step": "self_check",
+        },
+        workflow="reasoning_transparency",
+    )
+
+    prepared_input = workflow.prepare_input(test_config, None)
+    assert prepared_input.problem_description == workflow.PROBLEMS["simple_analytical"]
+    assert prepared_input.metadata["config_values"]["reasoning_mode"] == "native_r1"
+
+    output = workflow.run(prepared_input)
+    assert isinstance(output, ReasoningTransparencyOutput)
+    assert output.solution == "60 km/h"
+    assert output.reasoning_trace.startswith("Distance over time gives 120 / 2.")
+    assert output.reasoning_trace.endswith("Verification: The solution is correct.")
+    assert "Reasoning Mode: native_r1" in output.evaluation_text
+    assert output.metadata["test_number"] == 1
+    assert workflow.last_run_metadata is not None
+
+    solve_call, verify_call = fake_strategy.calls
+    assert workflow.PROBLEMS["simple_analytical"] in solve_call["prompt"]
+    assert solve_call["model"] == "openrouter/deepseek/deepseek-r1"
+    assert solve_call["config"] == {
+        "temperature": 0.2,
+        "max_tokens": 2000,
+        "reasoning_mode": "native_r1",
+    }
+    assert "Proposed solution: 60 km/h" in verify_call["prompt"]
+    assert verify_call["config"]["max_tokens"] == 300
+
+
+def test_reasoning_transparency_rejects_unknown_problem_complexity() -> None:
+    workflow = ReasoningTransparencyWorkflow()
+    test_config = TestConfiguration(
+        test_number=1,
+        config_values={"problem_complexity": "medium"},
+        workflow="reasoning_transparency",
+    )
+
+    with pytest.raises(ValueError, match="problem_complexity"):
+        workflow.prepare_input(test_config, None)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, Variable
+from tesseract_flow.experiments.taguchi import generate_test_configs
+
+
+@pytest.fixture(scope="session")
+def experiment_config(variable_corpus: tuple[Variable, ...]) -> ExperimentConfig:
+    """Shared four-variable experiment with default utility weights."""
+
+    return ExperimentConfig(
+        name="experiment",
+        workflow="code_review",
+        variables=list(variable_corpus),
+    )
+
+
+@pytest.fixture(scope="session")
+def base_test_configs(experiment_config: ExperimentConfig) -> tuple[TestConfiguration, ...]:
+    # A tuple so no test can append to the shared L8 array.
+    return tuple(generate_test_configs(experiment_config))
+
+
+@pytest.fixture
+def fake_litellm(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace ``litellm.acompletion`` for both strategies and the rubric evaluator.
+
+    Both modules call through the shared ``litellm`` module object, so a single patch covers
+    them. Tests configure ``return_value`` or ``side_effect`` on the returned mock.
+    """
+
+    fake = AsyncMock()
+    monkeypatch.setattr("litellm.acompletion", fake)
+    return fake
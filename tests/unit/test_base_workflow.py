@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
 from pydantic import BaseModel
 
 from tesseract_flow.core.base_workflow import BaseWorkflowService
-from tesseract_flow.core.config import WorkflowConfig
+from tesseract_flow.core.config import TestConfiguration, WorkflowConfig
 from tesseract_flow.core.exceptions import WorkflowExecutionError
 
 
@@ -55,6 +56,14 @@ class FailingWorkflow(BaseWorkflowService[ExampleInput, ExampleOutput]):
         return ExampleOutput.model_validate(result)
 
 
+class LinearWorkflow(ExampleWorkflow):
+    def _linear_steps(self) -> Any:
+        return (
+            lambda payload: {"value": payload["value"] + 1},
+            lambda state: {"doubled": state["value"] * 2},
+        )
+
+
 def test_base_workflow_run_executes_and_records_metadata() -> None:
     workflow = ExampleWorkflow(config=WorkflowConfig())
     output = workflow.run(ExampleInput(value=3))
@@ -70,6 +79,21 @@ def test_base_workflow_run_executes_and_records_metadata() -> None:
     assert workflow._build_count == 1
 
 
+def test_base_workflow_run_calls_linear_steps_without_graph() -> None:
+    workflow = LinearWorkflow(config=WorkflowConfig())
+    output = workflow.run(ExampleInput(value=3))
+    assert output.doubled == 8
+    assert workflow.last_run_metadata is not None
+    assert getattr(workflow, "_build_count", 0) == 0
+
+
+def test_base_workflow_run_uses_graph_when_langgraph_requested() -> None:
+    workflow = LinearWorkflow(config=WorkflowConfig(use_langgraph=True))
+    output = workflow.run(ExampleInput(value=3))
+    assert output.doubled == 6
+    assert workflow._build_count == 1
+
+
 def test_base_workflow_reset_rebuilds_graph() -> None:
     workflow = ExampleWorkflow(config=WorkflowConfig())
     workflow.run(ExampleInput(value=1))
@@ -83,3 +107,208 @@ def test_base_workflow_wraps_exceptions() -> None:
     workflow = FailingWorkflow(config=WorkflowConfig())
     with pytest.raises(WorkflowExecutionError):
         workflow.run(ExampleInput(value=1))
+
+
+class _CountingStrategy:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, prompt: str, *, model: str, config: Any = None) -> str:
+        self.calls += 1
+        return f"{prompt}:{self.calls}"
+
+
+def test_generate_cached_reuses_response_when_enabled() -> None:
+    BaseWorkflowService.clear_response_cache()
+    workflow = ExampleWorkflow(config=WorkflowConfig(response_cache_enabled=True))
+    strategy = _CountingStrategy()
+    kwargs = {
+        "strategy_name": "counting",
+        "model": "model",
+        "config": {"temperature": 0.0},
+        "use_cache": workflow._response_cache_enabled(),
+    }
+
+    first = workflow._generate_cached(strategy, "prompt", **kwargs)
+    second = workflow._generate_cached(strategy, "prompt", **kwargs)
+    other = workflow._generate_cached(strategy, "other", **kwargs)
+
+    assert first == second == "prompt:1"
+    assert other == "other:2"
+    assert strategy.calls == 2
+    BaseWorkflowService.clear_response_cache()
+
+
+def test_response_cache_enabled_accepts_mapping_workflow_config() -> None:
+    workflow = ExampleWorkflow(config=WorkflowConfig(response_cache_enabled=True))
+
+    assert workflow._response_cache_enabled({"response_cache_enabled": True}) is True
+    assert workflow._response_cache_enabled({}) is False
+    assert workflow._response_cache_enabled() is True
+
+
+def test_agenerate_cached_shares_cache_with_sync_path() -> None:
+    BaseWorkflowService.clear_response_cache()
+    workflow = ExampleWorkflow(config=WorkflowConfig(response_cache_enabled=True))
+    strategy = _CountingStrategy()
+    kwargs = {
+        "strategy_name": "counting",
+        "model": "model",
+        "config": {"temperature": 0.0},
+        "use_cache": True,
+    }
+
+    first = workflow._generate_cached(strategy, "prompt", **kwargs)
+    second = asyncio.run(workflow._agenerate_cached(strategy, "prompt", **kwargs))
+
+    assert first == second == "prompt:1"
+    assert strategy.calls == 1
+    BaseWorkflowService.clear_response_cache()
+
+
+def test_generate_cached_bypasses_cache_when_disabled() -> None:
+    workflow = ExampleWorkflow(config=WorkflowConfig())
+    strategy = _CountingStrategy()
+    assert workflow._response_cache_enabled() is False
+
+    for _ in range(2):
+        workflow._generate_cached(
+            strategy,
+            "prompt",
+            strategy_name="counting",
+            model="model",
+            config={"temperature": 0.0},
+            use_cache=False,
+        )
+
+    assert strategy.calls == 2
+
+
+def test_coerce_float_handles_numeric_and_invalid_values() -> None:
+    assert BaseWorkflowService._coerce_float(0.5, 1.0) == 0.5
+    assert BaseWorkflowService._coerce_float(2, 1.0) == 2.0
+    assert BaseWorkflowService._coerce_float("0.25", 1.0) == 0.25
+    assert BaseWorkflowService._coerce_float(None, 1.0) == 1.0
+    assert BaseWorkflowService._coerce_float("warm", 1.0) == 1.0
+
+
+class ConcurrentWorkflow(ExampleWorkflow):
+    def __init__(self) -> None:
+        super().__init__(config=WorkflowConfig())
+        self.in_flight = 0
+        self.peak = 0
+
+    def _prepare_async_run(self, test_config: Any, experiment_config: Any) -> int:
+        return int(test_config.config_values["value"])
+
+    async def _arun_prepared(self, state: int) -> dict[str, int]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01 * (5 - state))
+        self.in_flight -= 1
+        return {"doubled": state * 2}
+
+
+def _test_config(number: int, value: int) -> TestConfiguration:
+    return TestConfiguration(test_number=number, config_values={"value": value}, workflow="example")
+
+
+def test_arun_many_preserves_order_and_bounds_concurrency() -> None:
+    workflow = ConcurrentWorkflow()
+    configs = [_test_config(index + 1, index) for index in range(5)]
+
+    outputs = asyncio.run(workflow.arun_many(configs, max_concurrency=2))
+
+    assert [output.doubled for output in outputs] == [0, 2, 4, 6, 8]
+    assert workflow.peak == 2
+
+
+def test_arun_many_reads_max_parallel_from_workflow_config() -> None:
+    workflow = ConcurrentWorkflow()
+    workflow.config = WorkflowConfig(max_parallel=3)
+    configs = [_test_config(index + 1, index) for index in range(5)]
+
+    asyncio.run(workflow.arun_many(configs))
+
+    assert workflow.peak == 3
+
+
+def test_arun_many_requires_async_hooks() -> None:
+    workflow = ExampleWorkflow(config=WorkflowConfig())
+    with pytest.raises(NotImplementedError):
+        asyncio.run(workflow.arun_many([_test_config(1, 1)]))
+
+
+def test_await_coroutine_reuses_background_loop() -> None:
+    async def _running_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    first = BaseWorkflowService._await_coroutine(_running_loop())
+    second = BaseWorkflowService._await_coroutine(_running_loop())
+
+    assert first is second
+    assert first.is_running()
+    assert BaseWorkflowService._runner() is ExampleWorkflow._runner()
+
+
+def test_runner_rejects_blocking_on_its_own_loop() -> None:
+    async def _nested() -> str:
+        async def _inner() -> str:
+            return "never"
+
+        return BaseWorkflowService._await_coroutine(_inner())
+
+    with pytest.raises(RuntimeError):
+        BaseWorkflowService._await_coroutine(_nested())
+
+
+class BinnedWorkflow(ConcurrentWorkflow):
+    def _predict_output_tokens(self, state: int) -> int:
+        return 1000 if state % 2 else 50
+
+
+def test_arun_many_bins_tests_by_predicted_output_length() -> None:
+    workflow = BinnedWorkflow()
+    configs = [_test_config(index + 1, index) for index in range(5)]
+
+    outputs = asyncio.run(workflow.arun_many(configs, max_concurrency=4))
+
+    assert [output.doubled for output in outputs] == [0, 2, 4, 6, 8]
+    assert workflow.peak <= 4
+
+
+def test_arun_many_bounds_concurrency_across_bins() -> None:
+    workflow = BinnedWorkflow()
+    configs = [_test_config(index + 1, index) for index in range(5)]
+
+    outputs = asyncio.run(workflow.arun_many(configs, max_concurrency=1))
+
+    assert [output.doubled for output in outputs] == [0, 2, 4, 6, 8]
+    assert workflow.peak == 1
+
+
+class FailingConcurrentWorkflow(ConcurrentWorkflow):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = 0
+
+    async def _arun_prepared(self, state: int) -> dict[str, int]:
+        if state == 0:
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"doubled": state * 2}
+
+
+def test_arun_many_cancels_remaining_workers_on_failure() -> None:
+    workflow = FailingConcurrentWorkflow()
+    configs = [_test_config(index + 1, index) for index in range(3)]
+
+    with pytest.raises(WorkflowExecutionError) as excinfo:
+        asyncio.run(workflow.arun_many(configs, max_concurrency=3))
+
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+    assert workflow.cancelled == 2
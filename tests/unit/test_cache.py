@@ -8,18 +8,23 @@ import pytest
 from tesseract_flow.core.exceptions import CacheError
 from tesseract_flow.evaluation.cache import FileCacheBackend, build_cache_key
 
-
-def test_build_cache_key_is_deterministic() -> None:
-    key_one = build_cache_key("prompt", "model", 0.1234567)
-    key_two = build_cache_key("prompt", "model", 0.1234567)
-    assert key_one == key_two
-
-
-def test_build_cache_key_changes_with_input() -> None:
-    base = build_cache_key("prompt", "model", 0.1)
-    assert base != build_cache_key("prompt!", "model", 0.1)
-    assert base != build_cache_key("prompt", "other-model", 0.1)
-    assert base != build_cache_key("prompt", "model", 0.2)
+_BASE_KEY = build_cache_key("prompt", "model", 0.1)
+
+
+@pytest.mark.parametrize(
+    ("args", "same"),
+    [
+        (("prompt", "model", 0.1), True),
+        (("prompt", "model", 0.1000000001), True),
+        (("prompt!", "model", 0.1), False),
+        (("prompt", "other-model", 0.1), False),
+        (("prompt", "model", 0.2), False),
+    ],
+)
+def test_build_cache_key_matches_base_only_for_same_input(
+    args: tuple[str, str, float], same: bool
+) -> None:
+    assert (build_cache_key(*args) == _BASE_KEY) is same
 
 
 def test_file_cache_backend_round_trip(tmp_path: Path) -> None:
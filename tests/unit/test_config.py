@@ -1,6 +1,8 @@
 from pathlib import Path
+from typing import Any, TypeVar
 
 import pytest
+from pydantic import BaseModel
 
 from tesseract_flow.core.config import (
     ExperimentConfig,
@@ -15,31 +17,23 @@ from tesseract_flow.core.config import (
 from tesseract_flow.core.exceptions import ConfigurationError
 from tesseract_flow.evaluation.metrics import DimensionScore, QualityScore
 
+TModel = TypeVar("TModel", bound=BaseModel)
 
-@pytest.fixture
-def variables() -> list[Variable]:
-    return [
-        Variable(name="temperature", level_1=0.3, level_2=0.7),
-        Variable(name="model", level_1="gpt-4", level_2="claude"),
-        Variable(name="context", level_1="file", level_2="module"),
-        Variable(name="strategy", level_1="standard", level_2="cot"),
-    ]
 
+def _fast(cls: type[TModel], **data: Any) -> TModel:
+    """Build fixture models without validation; validation is covered by dedicated tests."""
 
-@pytest.fixture
-def experiment_config(variables: list[Variable]) -> ExperimentConfig:
-    return ExperimentConfig(
-        name="experiment",
-        workflow="code_review",
-        variables=variables,
-    )
+    return cls.model_construct(**data)
 
 
 def _quality_score(overall: float = 0.75) -> QualityScore:
-    return QualityScore(
+    # model_construct skips the validator that derives overall_score, so pass it directly.
+    return _fast(
+        QualityScore,
         dimension_scores={
-            "clarity": DimensionScore(score=overall, reasoning=""),
+            "clarity": _fast(DimensionScore, score=overall, reasoning=None),
         },
+        overall_score=overall,
         evaluator_model="gpt-4o",
     )
 
@@ -49,7 +43,8 @@ def _test_configurations(config: ExperimentConfig) -> list[TestConfiguration]:
         variable.name: variable.level_1 for variable in config.variables
     }
     return [
-        TestConfiguration(
+        _fast(
+            TestConfiguration,
             test_number=index + 1,
             config_values=dict(base_values),
             workflow=config.workflow,
@@ -79,15 +74,10 @@ def test_variable_validate_name_helpers() -> None:
         Variable._validate_name("")
 
 
-def test_variable_rejects_invalid_names() -> None:
-    with pytest.raises(ValueError):
-        Variable(name=" temperature ", level_1=0.1, level_2=0.9)
-
-    with pytest.raises(ValueError):
-        Variable(name="_hidden", level_1=0.1, level_2=0.9)
-
+@pytest.mark.parametrize("bad_name", [" temperature ", "_hidden", "invalid-name"])
+def test_variable_rejects_invalid_names(bad_name: str) -> None:
     with pytest.raises(ValueError):
-        Variable(name="invalid-name", level_1=0.1, level_2=0.9)
+        Variable(name=bad_name, level_1=0.1, level_2=0.9)
 
 
 def test_utility_weights_requires_positive_weight() -> None:
@@ -139,18 +129,16 @@ def test_experiment_config_validates_variable_count(variables: list[Variable]) -
     assert len(config.variables) == 4
 
 
+_EXTRA_VARIABLES = tuple(
+    Variable(name=f"extra_{index}", level_1=index, level_2=index + 1) for index in range(4, 8)
+)
+
+
 @pytest.mark.parametrize("count", [3, 8])
 def test_experiment_config_rejects_invalid_variable_counts(
     count: int, variables: list[Variable]
 ) -> None:
-    if count > len(variables):
-        extra = [
-            Variable(name=f"extra_{index}", level_1=index, level_2=index + 1)
-            for index in range(len(variables), count)
-        ]
-        selected = variables + extra
-    else:
-        selected = variables[:count]
+    selected = [*variables, *_EXTRA_VARIABLES][:count]
     with pytest.raises(ValueError):
         ExperimentConfig(
             name="experiment",
@@ -169,11 +157,14 @@ def test_experiment_config_requires_unique_variable_names(variables: list[Variab
         )
 
 
-def test_experiment_config_coerces_workflow_config_dict(tmp_path: Path, variables: list[Variable]) -> None:
+@pytest.fixture(scope="module")
+def workflow_config_round_trip(
+    tmp_path_factory: pytest.TempPathFactory, variable_corpus: tuple[Variable, ...]
+) -> tuple[ExperimentConfig, ExperimentConfig]:
     config = ExperimentConfig(
         name="experiment",
         workflow="code_review",
-        variables=variables,
+        variables=list(variable_corpus),
         workflow_config={
             "rubric": {
                 "clarity": {
@@ -185,14 +176,20 @@ def test_experiment_config_coerces_workflow_config_dict(tmp_path: Path, variable
             "extra_setting": True,
         },
     )
+    output_path = tmp_path_factory.mktemp("config") / "config.yaml"
+    config.to_yaml(output_path)
+    return config, ExperimentConfig.from_yaml(output_path)
+
+
+def test_experiment_config_coerces_workflow_config_dict(
+    workflow_config_round_trip: tuple[ExperimentConfig, ExperimentConfig],
+) -> None:
+    config, loaded = workflow_config_round_trip
     assert isinstance(config.workflow_config, WorkflowConfig)
     assert config.workflow_config.sample_code_path == "examples/code.py"
     assert config.workflow_config.rubric["clarity"]["scale"] == "1-5"
     assert getattr(config.workflow_config, "extra_setting") is True
 
-    output_path = tmp_path / "config.yaml"
-    config.to_yaml(output_path)
-    loaded = ExperimentConfig.from_yaml(output_path)
     assert loaded.name == config.name
     assert len(loaded.variables) == len(config.variables)
 
@@ -309,7 +306,8 @@ def test_experiment_run_records_result_and_updates_utility(
     ).mark_running()
 
     score = _quality_score(0.9)
-    result = TestResult(
+    result = _fast(
+        TestResult,
         test_number=1,
         config=test_configs[0],
         quality_score=score,
@@ -324,8 +322,8 @@ def test_experiment_run_records_result_and_updates_utility(
     assert updated.metadata["normalization"]["latency"] == {"min": 1500, "max": 1500}
     assert updated.baseline_result is not None
     assert updated.baseline_result.test_number == 1
-    assert updated.baseline_quality == pytest.approx(0.9)
-    assert updated.quality_improvement_pct == pytest.approx(0.0)
+    assert updated.baseline_quality == 0.9
+    assert updated.quality_improvement_pct == 0.0
 
 
 def test_experiment_run_requires_unique_results(experiment_config: ExperimentConfig) -> None:
@@ -351,6 +349,30 @@ def test_experiment_run_requires_unique_results(experiment_config: ExperimentCon
         run.record_result(result)
 
 
+def test_experiment_run_record_results_rejects_duplicates_within_batch(
+    experiment_config: ExperimentConfig,
+) -> None:
+    test_configs = _test_configurations(experiment_config)
+    run = ExperimentRun(
+        experiment_id="exp-1",
+        config=experiment_config,
+        test_configurations=test_configs,
+    ).mark_running()
+
+    result = _fast(
+        TestResult,
+        test_number=1,
+        config=test_configs[0],
+        quality_score=_quality_score(0.7),
+        cost=0.01,
+        latency=1200,
+        workflow_output="Result",
+    )
+
+    with pytest.raises(ValueError, match="already been recorded"):
+        run.record_results([result, result])
+
+
 def test_experiment_run_completion_requires_all_results(
     experiment_config: ExperimentConfig,
 ) -> None:
@@ -389,31 +411,29 @@ def test_experiment_run_can_complete_after_all_results(
         test_configurations=test_configs,
     ).mark_running()
 
-    baseline_quality: float | None = None
-    for index, config_item in enumerate(test_configs, start=1):
-        score = _quality_score(0.6 + index * 0.03)
-        result = TestResult(
+    results = [
+        _fast(
+            TestResult,
             test_number=config_item.test_number,
             config=config_item,
-            quality_score=score,
+            quality_score=_quality_score(0.6 + index * 0.03),
             cost=0.01 + index * 0.001,
             latency=1000 + index * 25,
             workflow_output=f"Result {index}",
         )
-        if baseline_quality is None:
-            baseline_quality = score.overall_score
-        run = run.record_result(result)
+        for index, config_item in enumerate(test_configs, start=1)
+    ]
+    baseline_quality = results[0].quality_score.overall_score
 
-    completed = run.mark_completed()
+    completed = run.record_results(results).mark_completed()
     assert completed.status == "COMPLETED"
     assert completed.completed_at is not None
     utilities = [result.utility for result in completed.results]
     assert utilities == sorted(utilities)
-    assert completed.metadata["normalization"]["cost"]["min"] == pytest.approx(0.011)
-    assert completed.metadata["normalization"]["latency"]["max"] == pytest.approx(1200)
+    assert completed.metadata["normalization"]["cost"]["min"] == 0.011
+    assert completed.metadata["normalization"]["latency"]["max"] == 1200
     assert completed.baseline_result is not None
     assert completed.baseline_result.test_number == 1
-    assert baseline_quality is not None
-    assert completed.baseline_quality == pytest.approx(baseline_quality)
+    assert completed.baseline_quality == baseline_quality
     assert completed.quality_improvement_pct is not None
     assert completed.quality_improvement_pct > 0
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from pathlib import Path
 from typing import Any, Dict, Iterable
@@ -22,6 +21,11 @@ from tesseract_flow.evaluation.metrics import DimensionScore, QualityScore
 from tesseract_flow.evaluation.rubric import RubricEvaluator
 from tesseract_flow.experiments.executor import ExperimentExecutor
 
+_OUTPUTS = tuple(f"Run {idx}" for idx in range(8))
+_PAYLOAD_JSON = json.dumps(
+    {dimension: {"score": 8, "reasoning": "ok"} for dimension in RubricEvaluator.DEFAULT_RUBRIC_DIMS}
+)
+
 
 @pytest.mark.asyncio
 async def test_rubric_evaluator_retries_before_success(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -32,11 +36,7 @@ async def test_rubric_evaluator_retries_before_success(monkeypatch: pytest.Monke
         attempts += 1
         if attempts < 3:
             raise RuntimeError("temporary failure")
-        payload = {
-            dimension: {"score": 8, "reasoning": "ok"}
-            for dimension in RubricEvaluator.DEFAULT_RUBRIC
-        }
-        return {"choices": [{"message": {"content": json.dumps(payload)}}]}
+        return {"choices": [{"message": {"content": _PAYLOAD_JSON}}]}
 
     async def no_sleep(_: float) -> None:  # pragma: no cover - deterministic stub
         return None
@@ -90,7 +90,10 @@ def test_experiment_config_from_yaml_provides_error_details(tmp_path: Path) -> N
     assert any("workflow" in detail.lower() for detail in exc_info.value.details)
 
 
-def test_executor_persists_partial_results_on_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.asyncio
+async def test_executor_persists_partial_results_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     variables = [
         Variable(name="temperature", level_1=0.1, level_2=0.9),
         Variable(name="model", level_1="gpt-4", level_2="claude"),
@@ -135,8 +138,7 @@ def test_executor_persists_partial_results_on_failure(tmp_path: Path, monkeypatc
     class DummyWorkflow(BaseWorkflowService[TestConfiguration, DummyOutput]):
         def __init__(self, outputs: Iterable[str]) -> None:
             super().__init__()
-            self._outputs = list(outputs)
-            self._index = 0
+            self._outputs = iter(outputs)
 
         def _build_workflow(self) -> Any:  # type: ignore[override]
             workflow = self
@@ -148,13 +150,11 @@ def test_executor_persists_partial_results_on_failure(tmp_path: Path, monkeypatc
             return _Graph()
 
         def _validate_output(self, result: Any) -> DummyOutput:
-            return DummyOutput(review=result)
+            return DummyOutput.model_construct(review=result, cost=0.0, latency_ms=5.0)
 
         # BaseWorkflowService expects compiled graph with invoke method.
         def invoke(self, payload: Dict[str, Any]) -> str:  # type: ignore[override]
-            value = self._outputs[self._index]
-            self._index += 1
-            return value
+            return next(self._outputs)
 
     class FakeEvaluator:
         def __init__(self) -> None:
@@ -171,8 +171,7 @@ def test_executor_persists_partial_results_on_failure(tmp_path: Path, monkeypatc
                 evaluator_model="test-model",
             )
 
-    outputs = [f"Run {idx}" for idx in range(8)]
-    workflow = DummyWorkflow(outputs)
+    workflow = DummyWorkflow(_OUTPUTS)
 
     def resolver(_: str, __: ExperimentConfig) -> DummyWorkflow:
         return workflow
@@ -182,11 +181,9 @@ def test_executor_persists_partial_results_on_failure(tmp_path: Path, monkeypatc
     persist_path = tmp_path / "partial_results.json"
 
     with pytest.raises(ExperimentError):
-        asyncio.run(
-            executor.run(
-                config,
-                persist_path=persist_path,
-            )
+        await executor.run(
+            config,
+            persist_path=persist_path,
         )
 
     assert persist_path.exists()
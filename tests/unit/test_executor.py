@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 import pytest
 
@@ -12,14 +13,11 @@ from tesseract_flow.core.config import (
     ExperimentRun,
     TestConfiguration,
     TestResult,
-    UtilityWeights,
-    Variable,
     WorkflowConfig,
 )
 from tesseract_flow.core.exceptions import ExperimentError
 from tesseract_flow.evaluation.metrics import DimensionScore, QualityScore
 from tesseract_flow.experiments.executor import ExperimentExecutor
-from tesseract_flow.experiments.taguchi import generate_test_configs
 
 
 class DummyWorkflowOutput:
@@ -34,9 +32,8 @@ class DummyWorkflowOutput:
 
 
 class StubWorkflowService:
-    def __init__(self, outputs: List[DummyWorkflowOutput]) -> None:
-        self._outputs = outputs
-        self._index = 0
+    def __init__(self, outputs: Iterable[DummyWorkflowOutput]) -> None:
+        self._outputs = iter(outputs)
         self.last_run_metadata: Dict[str, Any] | None = None
         self.config = WorkflowConfig()
 
@@ -44,8 +41,7 @@ class StubWorkflowService:
         return {"test_number": test_config.test_number, "config": test_config.config_values}
 
     def run(self, input_data: Dict[str, Any]) -> DummyWorkflowOutput:
-        output = self._outputs[self._index]
-        self._index += 1
+        output = next(self._outputs)
         self.last_run_metadata = {"duration_seconds": output.latency_ms / 1000.0}
         return output
 
@@ -69,32 +65,29 @@ class StubEvaluator:
         return score.with_metadata(call=self.calls, rubric=rubric)
 
 
-@pytest.fixture
-def experiment_config() -> ExperimentConfig:
-    variables = [
-        Variable(name="temperature", level_1=0.3, level_2=0.7),
-        Variable(name="model", level_1="gpt-4", level_2="claude"),
-        Variable(name="context", level_1="file", level_2="module"),
-        Variable(name="strategy", level_1="standard", level_2="cot"),
-    ]
-    return ExperimentConfig(
-        name="executor_test",
-        workflow="code_review",
-        variables=variables,
-        utility_weights=UtilityWeights(),
-    )
+@pytest.fixture(scope="module")
+def experiment_metadata(experiment_config: ExperimentConfig) -> ExperimentMetadata:
+    return ExperimentMetadata.from_config(experiment_config, dependencies={"pydantic": "2"})
 
 
-def _quality_score(value: float) -> QualityScore:
+@lru_cache(maxsize=128)
+def _validated_quality_score(value: float) -> QualityScore:
     return QualityScore(
         dimension_scores={"clarity": DimensionScore(score=value, reasoning="")},
         evaluator_model="stub",
     )
 
 
+def _quality_score(value: float) -> QualityScore:
+    # QualityScore is mutable, so callers get a copy of the cached validated instance.
+    return _validated_quality_score(value).model_copy()
+
+
 @pytest.mark.asyncio
-async def test_run_single_test_returns_result(experiment_config: ExperimentConfig) -> None:
-    test_config = generate_test_configs(experiment_config)[0]
+async def test_run_single_test_returns_result(
+    experiment_config: ExperimentConfig, base_test_configs: tuple[TestConfiguration, ...]
+) -> None:
+    test_config = base_test_configs[0]
     outputs = [
         DummyWorkflowOutput(
             evaluation_text="Comprehensive review",
@@ -114,10 +107,10 @@ async def test_run_single_test_returns_result(experiment_config: ExperimentConfi
         experiment_config=experiment_config,
     )
 
-    assert result.cost == pytest.approx(0.005)
-    assert result.latency == pytest.approx(2100)
+    assert result.cost == 0.005
+    assert result.latency == 2100
     assert "workflow" in result.metadata
-    assert result.quality_score.overall_score == pytest.approx(0.8)
+    assert result.quality_score.overall_score == 0.8
     assert result.metadata["evaluation"]["model"] == "stub-model"
 
 
@@ -125,7 +118,7 @@ async def test_run_single_test_returns_result(experiment_config: ExperimentConfi
 async def test_run_executes_all_tests_and_persists(
     experiment_config: ExperimentConfig, tmp_path: Path
 ) -> None:
-    outputs = [
+    outputs = (
         DummyWorkflowOutput(
             evaluation_text=f"Review {index}",
             cost=0.001 * index,
@@ -133,7 +126,7 @@ async def test_run_executes_all_tests_and_persists(
             metadata={"index": index},
         )
         for index in range(1, 9)
-    ]
+    )
     service = StubWorkflowService(outputs)
     evaluator = StubEvaluator()
     executor = ExperimentExecutor(lambda workflow, config: service, evaluator)
@@ -164,16 +157,17 @@ async def test_run_executes_all_tests_and_persists(
 
 @pytest.mark.asyncio
 async def test_run_resumes_from_partial_state(
-    experiment_config: ExperimentConfig, tmp_path: Path
+    experiment_config: ExperimentConfig,
+    base_test_configs: tuple[TestConfiguration, ...],
+    experiment_metadata: ExperimentMetadata,
+    tmp_path: Path,
 ) -> None:
-    test_configs = generate_test_configs(experiment_config)
+    test_configs = base_test_configs
     base_run = ExperimentRun(
         experiment_id="resume-test",
         config=experiment_config,
-        test_configurations=test_configs,
-        experiment_metadata=ExperimentMetadata.from_config(
-            experiment_config, dependencies={"pydantic": "2"}
-        ),
+        test_configurations=list(test_configs),
+        experiment_metadata=experiment_metadata,
     ).mark_running(started_at=datetime.now(tz=timezone.utc))
 
     first_result = TestResult(
@@ -196,14 +190,14 @@ async def test_run_resumes_from_partial_state(
     base_run = base_run.record_result(first_result)
     base_run = base_run.record_result(second_result)
 
-    outputs = [
+    outputs = (
         DummyWorkflowOutput(
             evaluation_text=f"Resume {index}",
             cost=0.002 * index,
             latency_ms=1800 + (index * 5),
         )
         for index in range(3, 9)
-    ]
+    )
     service = StubWorkflowService(outputs)
     evaluator = StubEvaluator()
     executor = ExperimentExecutor(lambda workflow, config: service, evaluator)
@@ -221,12 +215,13 @@ async def test_run_resumes_from_partial_state(
 
 
 @pytest.mark.asyncio
-async def test_resume_rejects_mismatched_config(experiment_config: ExperimentConfig) -> None:
-    test_configs = generate_test_configs(experiment_config)
+async def test_resume_rejects_mismatched_config(
+    experiment_config: ExperimentConfig, base_test_configs: tuple[TestConfiguration, ...]
+) -> None:
     run = ExperimentRun(
         experiment_id="resume-fail",
         config=experiment_config,
-        test_configurations=test_configs,
+        test_configurations=list(base_test_configs),
     )
 
     modified_config = experiment_config.model_copy(update={"name": "different"})
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pytest
 import yaml
 
@@ -13,13 +15,19 @@ from tesseract_flow.experiments.analysis import (
 from tesseract_flow.experiments.taguchi import generate_test_configs
 
 
-def _quality_score(value: float) -> QualityScore:
+@lru_cache(maxsize=128)
+def _validated_quality_score(value: float) -> QualityScore:
     return QualityScore(
         dimension_scores={"clarity": DimensionScore(score=value, reasoning="solid")},
         evaluator_model="stub",
     )
 
 
+def _quality_score(value: float) -> QualityScore:
+    # QualityScore is mutable, so callers get a copy of the cached validated instance.
+    return _validated_quality_score(value).model_copy()
+
+
 def test_main_effects_analysis_and_exports(tmp_path) -> None:
     variables = [
         Variable(name="temperature", level_1=0.2, level_2=0.8),
@@ -51,19 +59,20 @@ def test_main_effects_analysis_and_exports(tmp_path) -> None:
         8: 0.90,
     }
 
-    for test_config in test_configs:
-        quality = _quality_score(quality_values[test_config.test_number])
-        result = TestResult(
+    results = [
+        # Field values are known-good; record_results() fills in the real utility.
+        TestResult.model_construct(
             test_number=test_config.test_number,
             config=test_config,
-            quality_score=quality,
+            quality_score=_quality_score(quality_values[test_config.test_number]),
             cost=0.01,
             latency=1000.0,
+            utility=0.0,
             workflow_output=f"output {test_config.test_number}",
         )
-        run = run.record_result(result)
-
-    run = run.mark_completed()
+        for test_config in test_configs
+    ]
+    run = run.record_results(results).mark_completed()
 
     main_effects = MainEffectsAnalyzer.compute(
         run.results, config.variables, experiment_id=run.experiment_id
@@ -100,6 +109,7 @@ def test_main_effects_analysis_and_exports(tmp_path) -> None:
         workflow=config.workflow,
     )
     assert exported == export_path
+
     exported_payload = yaml.safe_load(export_path.read_text(encoding="utf-8"))
     assert exported_payload["experiment"] == "analysis-test"
     assert exported_payload["workflow"] == "code_review"
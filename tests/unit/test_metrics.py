@@ -1,6 +1,7 @@
 """Unit tests for evaluation metrics models."""
 from __future__ import annotations
 
+import math
 from datetime import datetime, timezone
 
 import pytest
@@ -20,7 +21,7 @@ def test_quality_score_computes_overall_mean() -> None:
         overall_score=0.0,  # Should be recalculated to the mean
     )
     expected_mean = (0.8 + 0.6 + 1.0) / 3
-    assert score.overall_score == pytest.approx(expected_mean)
+    assert math.isclose(score.overall_score, expected_mean, abs_tol=1e-9)
 
 
 def test_quality_score_rejects_empty_dimensions() -> None:
@@ -0,0 +1,119 @@
+"""Tests for complexity routing in the multi-task benchmark workflow."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tesseract_flow.core.config import ExperimentConfig, TestConfiguration, WorkflowConfig
+from tesseract_flow.workflows.multi_task_benchmark import (
+    _ROUTING_THRESHOLD,
+    MultiTaskBenchmarkWorkflow,
+    _complexity_score,
+)
+
+_ROUTED_CONFIG = WorkflowConfig(complexity_routing_model="cheap-model")
+_SIMPLE_VALUES = {"model": "large-model", "task_type": "analytical"}
+_DEMANDING_VALUES = {
+    "model": "large-model",
+    "task_type": "creative",
+    "example_count": 2,
+    "reasoning_visibility": "explicit_chain",
+    "output_format": "structured",
+}
+
+
+def _test_config(values: dict[str, Any]) -> TestConfiguration:
+    return TestConfiguration(test_number=1, config_values=values, workflow="multi_task_benchmark")
+
+
+def test_prepare_input_keeps_model_without_routing_model() -> None:
+    workflow = MultiTaskBenchmarkWorkflow(config=WorkflowConfig())
+
+    workflow_input = workflow.prepare_input(_test_config(_SIMPLE_VALUES), None)
+
+    assert workflow._runtime is not None
+    assert workflow._runtime.model == "large-model"
+    assert "complexity_score" not in workflow_input.metadata
+    assert "routed_model" not in workflow_input.metadata
+
+
+def test_prepare_input_routes_simple_configurations_to_cheaper_model() -> None:
+    workflow = MultiTaskBenchmarkWorkflow(config=_ROUTED_CONFIG)
+
+    workflow_input = workflow.prepare_input(_test_config(_SIMPLE_VALUES), None)
+
+    assert workflow._runtime is not None
+    assert workflow._runtime.model == "cheap-model"
+    assert workflow_input.metadata["complexity_score"] < _ROUTING_THRESHOLD
+    assert workflow_input.metadata["routed_model"] == "cheap-model"
+
+
+def test_prepare_input_routes_with_mapping_workflow_config() -> None:
+    workflow = MultiTaskBenchmarkWorkflow(config=WorkflowConfig())
+    # model_construct keeps the plain mapping that validation would coerce to WorkflowConfig.
+    experiment_config = ExperimentConfig.model_construct(
+        workflow_config={"complexity_routing_model": "cheap-model"}
+    )
+
+    workflow_input = workflow.prepare_input(_test_config(_SIMPLE_VALUES), experiment_config)
+
+    assert workflow._runtime is not None
+    assert workflow._runtime.model == "cheap-model"
+    assert workflow_input.metadata["routed_model"] == "cheap-model"
+
+
+def test_prepare_input_keeps_model_at_routing_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    simple_score = _complexity_score(
+        "analytical",
+        0,
+        "silent_thinking",
+        "freeform",
+        len(MultiTaskBenchmarkWorkflow._TASK_DESCRIPTIONS["analytical"]),
+    )
+    monkeypatch.setattr(
+        "tesseract_flow.workflows.multi_task_benchmark._ROUTING_THRESHOLD", simple_score
+    )
+    workflow = MultiTaskBenchmarkWorkflow(config=_ROUTED_CONFIG)
+
+    workflow_input = workflow.prepare_input(_test_config(_SIMPLE_VALUES), None)
+
+    assert workflow._runtime is not None
+    assert workflow._runtime.model == "large-model"
+    assert workflow_input.metadata["complexity_score"] == simple_score
+    assert workflow_input.metadata["routed_model"] == "large-model"
+
+
+def test_prepare_input_keeps_model_above_routing_threshold() -> None:
+    workflow = MultiTaskBenchmarkWorkflow(config=_ROUTED_CONFIG)
+
+    workflow_input = workflow.prepare_input(_test_config(_DEMANDING_VALUES), None)
+
+    assert workflow._runtime is not None
+    assert workflow._runtime.model == "large-model"
+    assert workflow_input.metadata["complexity_score"] >= _ROUTING_THRESHOLD
+    assert workflow_input.metadata["routed_model"] == "large-model"
+
+
+def test_complexity_score_weights_each_setting() -> None:
+    assert _complexity_score("analytical", 0, "silent_thinking", "freeform", 0) == 0.0
+    assert _complexity_score("analytical", 1, "silent_thinking", "freeform", 100) == 2.25
+    assert _complexity_score("creative", 2, "explicit_chain", "structured", 400) == 10.0
+
+
+def test_prepare_input_uses_execute_task_prompt_override() -> None:
+    default_workflow = MultiTaskBenchmarkWorkflow(config=WorkflowConfig())
+    default_workflow.prepare_input(_test_config(_SIMPLE_VALUES), None)
+    override_workflow = MultiTaskBenchmarkWorkflow(
+        config=WorkflowConfig(
+            prompts={"execute_task": "Custom {{task_type}} task: {{task_description}}"}
+        )
+    )
+
+    override_workflow.prepare_input(_test_config(_SIMPLE_VALUES), None)
+
+    assert override_workflow._runtime is not None
+    skeleton = override_workflow._runtime.prompt_skeleton
+    assert skeleton == "Custom analytical task: {task_description}"
+    assert default_workflow._runtime is not None
+    assert default_workflow._runtime.prompt_skeleton.startswith("You are an AI assistant")
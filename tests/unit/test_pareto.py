@@ -8,6 +8,8 @@ from tesseract_flow.core.config import TestConfiguration, TestResult
 from tesseract_flow.evaluation.metrics import DimensionScore, QualityScore
 from tesseract_flow.optimization.pareto import ParetoFrontier
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
 
 def _make_result(
     test_number: int,
@@ -27,7 +29,7 @@ def _make_result(
         dimension_scores={"overall": DimensionScore(score=quality)},
         evaluator_model="test-model",
     )
-    return TestResult(
+    return TestResult.model_construct(
         test_number=test_number,
         config=config,
         quality_score=score,
@@ -38,16 +40,23 @@ def _make_result(
     )
 
 
-def test_compute_pareto_frontier_identifies_optimal_points() -> None:
-    results = [
+@pytest.fixture(scope="module")
+def pareto_stub_results() -> tuple[TestResult, ...]:
+    """Five results where 1-4 form the frontier and 5 is dominated."""
+
+    return (
         _make_result(1, quality=0.70, cost=0.002, latency=120.0),
         _make_result(2, quality=0.85, cost=0.004, latency=160.0),
         _make_result(3, quality=0.83, cost=0.003, latency=140.0),
         _make_result(4, quality=0.90, cost=0.006, latency=220.0),
         _make_result(5, quality=0.78, cost=0.005, latency=180.0),
-    ]
+    )
+
 
-    frontier = ParetoFrontier.compute(results, experiment_id="run-123")
+def test_compute_pareto_frontier_identifies_optimal_points(
+    pareto_stub_results: tuple[TestResult, ...],
+) -> None:
+    frontier = ParetoFrontier.compute(pareto_stub_results, experiment_id="run-123")
 
     optimal_numbers = {point.test_number for point in frontier.optimal_points}
     assert optimal_numbers == {1, 2, 3, 4}
@@ -78,14 +87,8 @@ def test_compute_pareto_frontier_with_single_optimal() -> None:
     assert dominated == {2: 1, 3: 1}
 
 
-def test_budget_helpers_identify_candidates() -> None:
-    results = [
-        _make_result(1, quality=0.70, cost=0.002, latency=120.0),
-        _make_result(2, quality=0.85, cost=0.004, latency=160.0),
-        _make_result(3, quality=0.83, cost=0.003, latency=140.0),
-        _make_result(4, quality=0.90, cost=0.006, latency=220.0),
-    ]
-    frontier = ParetoFrontier.compute(results, experiment_id="run-budget")
+def test_budget_helpers_identify_candidates(pareto_stub_results: tuple[TestResult, ...]) -> None:
+    frontier = ParetoFrontier.compute(pareto_stub_results[:4], experiment_id="run-budget")
 
     within = frontier.points_within_budget(0.0045)
     assert [point.test_number for point in within] == [1, 2, 3]
@@ -98,14 +101,21 @@ def test_budget_helpers_identify_candidates() -> None:
         frontier.points_within_budget(-0.1)
 
 
-def test_visualize_generates_image(tmp_path: Path) -> None:
-    results = [
-        _make_result(1, quality=0.70, cost=0.002, latency=120.0),
-        _make_result(2, quality=0.85, cost=0.004, latency=160.0),
-        _make_result(3, quality=0.83, cost=0.003, latency=140.0),
-        _make_result(4, quality=0.90, cost=0.006, latency=220.0),
-    ]
-    frontier = ParetoFrontier.compute(results, experiment_id="run-visual")
+def _visual_frontier(results: tuple[TestResult, ...]) -> ParetoFrontier:
+    return ParetoFrontier.compute(results[:4], experiment_id="run-visual")
+
+
+def test_visualize_generates_image(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pareto_stub_results: tuple[TestResult, ...],
+) -> None:
+    # Only the path plumbing is checked here; the real render runs in the slow test below.
+    monkeypatch.setattr(
+        "matplotlib.figure.Figure.savefig",
+        lambda self, path, *args, **kwargs: Path(path).write_bytes(_PNG_SIGNATURE),
+    )
+    frontier = _visual_frontier(pareto_stub_results)
 
     output_path = tmp_path / "pareto.png"
     image_path = frontier.visualize(output_path, budget_threshold=0.0045)
@@ -114,6 +124,15 @@ def test_visualize_generates_image(tmp_path: Path) -> None:
     assert output_path.exists()
 
 
+@pytest.mark.slow
+def test_visualize_renders_png(tmp_path: Path, pareto_stub_results: tuple[TestResult, ...]) -> None:
+    frontier = _visual_frontier(pareto_stub_results)
+
+    output_path = frontier.visualize(tmp_path / "pareto.png", budget_threshold=0.0045)
+
+    assert output_path.read_bytes().startswith(_PNG_SIGNATURE)
+
+
 def test_compute_with_latency_axis() -> None:
     results = [
         _make_result(1, quality=0.88, cost=0.004, latency=300.0),
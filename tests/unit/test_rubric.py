@@ -2,26 +2,57 @@
 from __future__ import annotations
 
 import json
-from typing import Dict
+from types import MappingProxyType
+from unittest.mock import AsyncMock
 
 import pytest
 
 from tesseract_flow.core.exceptions import EvaluationError
 from tesseract_flow.evaluation.rubric import RubricEvaluator
 
+_PAYLOAD_JSON = json.dumps(
+    {
+        "clarity": {"score": 8, "reasoning": "Clear enough."},
+        "accuracy": {"score": 7, "reasoning": "Mostly correct."},
+        "completeness": {"score": 9, "reasoning": "Thorough."},
+        "usefulness": {"score": 6, "reasoning": "Actionable."},
+    }
+)
+_UNIFORM_PAYLOAD_JSON = json.dumps(
+    {dimension: {"score": 6, "reasoning": "Ok."} for dimension in RubricEvaluator.DEFAULT_RUBRIC_DIMS}
+)
+_ONE_DIM_RUBRIC = MappingProxyType({"clarity": RubricEvaluator.DEFAULT_RUBRIC["clarity"]})
+_TWO_DIM_RUBRIC = MappingProxyType(
+    {name: RubricEvaluator.DEFAULT_RUBRIC[name] for name in ("clarity", "accuracy")}
+)
+
+
+class _InMemoryCache(dict[str, str]):
+    """CacheBackend over a plain dict: get and clear are inherited, set is item assignment."""
+
+    set = dict.__setitem__
+
+
+class _Message:
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content: str) -> None:
+        self.message = _Message(content)
+
 
-class _InMemoryCache:
-    def __init__(self) -> None:
-        self.store: Dict[str, str] = {}
+class _Response:
+    def __init__(self, content: str) -> None:
+        self.choices = [_Choice(content)]
 
-    def get(self, key: str) -> str | None:
-        return self.store.get(key)
 
-    def set(self, key: str, value: str) -> None:
-        self.store[key] = value
+@pytest.fixture(scope="module")
+def evaluator() -> RubricEvaluator:
+    """Shared default evaluator for tests that neither configure a cache nor mutate it."""
 
-    def clear(self) -> None:  # pragma: no cover - helper API completeness
-        self.store.clear()
+    return RubricEvaluator()
 
 
 def test_constructor_requires_model_identifier() -> None:
@@ -30,207 +61,121 @@ def test_constructor_requires_model_identifier() -> None:
 
 
 @pytest.mark.asyncio
-async def test_evaluate_requires_non_empty_output() -> None:
-    evaluator = RubricEvaluator()
+async def test_evaluate_requires_non_empty_output(evaluator: RubricEvaluator) -> None:
     with pytest.raises(EvaluationError):
         await evaluator.evaluate("   ")
 
 
 @pytest.mark.asyncio
-async def test_evaluate_requires_non_empty_model_override() -> None:
-    evaluator = RubricEvaluator()
+async def test_evaluate_requires_non_empty_model_override(evaluator: RubricEvaluator) -> None:
     with pytest.raises(EvaluationError):
         await evaluator.evaluate("valid output", model="  ")
 
 
-def test_extract_response_content_requires_choices() -> None:
-    evaluator = RubricEvaluator()
+@pytest.mark.parametrize(
+    "bad_response",
+    [{}, {"choices": [{}]}, {"choices": [{"message": {"content": 123}}]}],
+    ids=["no-choices", "no-message", "non-string-content"],
+)
+def test_extract_response_content_rejects(evaluator: RubricEvaluator, bad_response: object) -> None:
     with pytest.raises(EvaluationError):
-        evaluator._extract_response_content({})  # type: ignore[arg-type]
-
-
-def test_extract_response_content_requires_message() -> None:
-    evaluator = RubricEvaluator()
-    response = {"choices": [{}]}
-    with pytest.raises(EvaluationError):
-        evaluator._extract_response_content(response)
-
-
-def test_extract_response_content_concatenates_list_parts() -> None:
-    evaluator = RubricEvaluator()
-    response = {
-        "choices": [
-            {
-                "message": {
-                    "content": [
-                        {"text": "part 1 "},
-                        {"text": "and part 2"},
-                    ]
-                }
-            }
-        ]
-    }
-    content = evaluator._extract_response_content(response)
-    assert content == "part 1 and part 2"
-
-
-def test_parse_dimension_scores_requires_all_dimensions() -> None:
-    evaluator = RubricEvaluator()
+        evaluator._extract_response_content(bad_response)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        (
+            {"choices": [{"message": {"content": [{"text": "part 1 "}, {"text": "and part 2"}]}}]},
+            "part 1 and part 2",
+        ),
+        (_Response("object based content"), "object based content"),
+    ],
+    ids=["list-parts", "choice-objects"],
+)
+def test_extract_response_content_reads_content(
+    evaluator: RubricEvaluator, response: object, expected: str
+) -> None:
+    assert evaluator._extract_response_content(response) == expected  # type: ignore[arg-type]
+
+
+def test_parse_dimension_scores_requires_all_dimensions(evaluator: RubricEvaluator) -> None:
     payload = {"clarity": {"score": 5}}
-    rubric = {"clarity": RubricEvaluator.DEFAULT_RUBRIC["clarity"], "accuracy": RubricEvaluator.DEFAULT_RUBRIC["accuracy"]}
     with pytest.raises(EvaluationError):
-        evaluator._parse_dimension_scores(payload, rubric)
+        evaluator._parse_dimension_scores(payload, _TWO_DIM_RUBRIC)
 
 
-def test_normalize_score_rejects_out_of_range_values() -> None:
-    evaluator = RubricEvaluator()
+@pytest.mark.parametrize(
+    "bad",
+    [11, ["not", "numeric"], "   ", float("nan"), "nan"],
+    ids=["out-of-range", "invalid-type", "empty-string", "non-finite", "non-finite-string"],
+)
+def test_normalize_score_rejects(evaluator: RubricEvaluator, bad: object) -> None:
     with pytest.raises(EvaluationError):
-        evaluator._normalize_score(11)
+        evaluator._normalize_score(bad)  # type: ignore[arg-type]
 
 
-def test_normalize_score_rejects_invalid_types() -> None:
-    evaluator = RubricEvaluator()
-    with pytest.raises(EvaluationError):
-        evaluator._normalize_score(["not", "numeric"])  # type: ignore[arg-type]
-
-
-def test_validate_temperature_bounds() -> None:
-    evaluator = RubricEvaluator()
-    with pytest.raises(ValueError):
-        evaluator._validate_temperature(-0.1)
+@pytest.mark.parametrize("temperature", [-0.1, 1.5])
+def test_validate_temperature_bounds(evaluator: RubricEvaluator, temperature: float) -> None:
     with pytest.raises(ValueError):
-        evaluator._validate_temperature(1.5)
-
-
-def test_extract_response_content_supports_choice_objects() -> None:
-    evaluator = RubricEvaluator()
-
-    class _Message:
-        def __init__(self, content: str) -> None:
-            self.content = content
+        evaluator._validate_temperature(temperature)
 
-    class _Choice:
-        def __init__(self, content: str) -> None:
-            self.message = _Message(content)
 
-    class _Response:
-        def __init__(self, content: str) -> None:
-            self.choices = [_Choice(content)]
-
-    response = _Response("object based content")
-    assert evaluator._extract_response_content(response) == "object based content"
-
-
-def test_extract_response_content_requires_string_content() -> None:
-    evaluator = RubricEvaluator()
-    response = {"choices": [{"message": {"content": 123}}]}
-    with pytest.raises(EvaluationError):
-        evaluator._extract_response_content(response)
-
-
-def test_parse_dimension_scores_accepts_numeric_entries() -> None:
-    evaluator = RubricEvaluator()
-    rubric = {"clarity": RubricEvaluator.DEFAULT_RUBRIC["clarity"]}
+def test_parse_dimension_scores_accepts_numeric_entries(evaluator: RubricEvaluator) -> None:
     payload = {"clarity": 8}
-    scores = evaluator._parse_dimension_scores(payload, rubric)
-    assert scores["clarity"].score == pytest.approx(0.8)
-
+    scores = evaluator._parse_dimension_scores(payload, _ONE_DIM_RUBRIC)
+    assert scores["clarity"].score == 0.8
 
-def test_normalize_score_accepts_unit_interval() -> None:
-    evaluator = RubricEvaluator()
-    assert evaluator._normalize_score(0.4) == pytest.approx(0.4)
 
-
-def test_normalize_score_rejects_empty_string() -> None:
-    evaluator = RubricEvaluator()
-    with pytest.raises(EvaluationError):
-        evaluator._normalize_score("   ")
-
-
-def test_normalize_score_rejects_non_finite() -> None:
-    evaluator = RubricEvaluator()
-    with pytest.raises(EvaluationError):
-        evaluator._normalize_score(float("nan"))
-
-def test_normalize_score_rejects_non_finite_string() -> None:
-    evaluator = RubricEvaluator()
-    with pytest.raises(EvaluationError):
-        evaluator._normalize_score("nan")
+def test_normalize_score_accepts_unit_interval(evaluator: RubricEvaluator) -> None:
+    assert evaluator._normalize_score(0.4) == 0.4
 
 
 @pytest.mark.asyncio
-async def test_evaluate_records_cache_entry(monkeypatch: pytest.MonkeyPatch) -> None:
-    payload = {
-        "clarity": {"score": 8, "reasoning": "Clear enough."},
-        "accuracy": {"score": 7, "reasoning": "Mostly correct."},
-        "completeness": {"score": 9, "reasoning": "Thorough."},
-        "usefulness": {"score": 6, "reasoning": "Actionable."},
-    }
-
-    async def fake_acompletion(*args: object, **kwargs: object) -> dict[str, object]:
-        return {"choices": [{"message": {"content": json.dumps(payload)}}]}
-
-    monkeypatch.setattr(
-        "tesseract_flow.evaluation.rubric.litellm.acompletion",
-        fake_acompletion,
-    )
+async def test_evaluate_records_cache_entry(fake_litellm: AsyncMock) -> None:
+    fake_litellm.return_value = {"choices": [{"message": {"content": _PAYLOAD_JSON}}]}
 
     cache = _InMemoryCache()
     evaluator = RubricEvaluator(cache=cache, record_cache=True)
     score = await evaluator.evaluate("Example output")
 
+    fake_litellm.assert_awaited_once()
     cache_key = score.metadata["cache_key"]
-    assert cache.store[cache_key] == json.dumps(payload)
+    assert cache[cache_key] == _PAYLOAD_JSON
     assert score.metadata["cache_hit"] is False
     assert score.metadata["cache_recorded"] is True
 
 
 @pytest.mark.asyncio
-async def test_evaluate_uses_cached_response(monkeypatch: pytest.MonkeyPatch) -> None:
-    payload = {
-        "clarity": {"score": 6, "reasoning": "Ok."},
-        "accuracy": {"score": 6, "reasoning": "Ok."},
-        "completeness": {"score": 6, "reasoning": "Ok."},
-        "usefulness": {"score": 6, "reasoning": "Ok."},
-    }
-
+async def test_evaluate_uses_cached_response(fake_litellm: AsyncMock) -> None:
     cache = _InMemoryCache()
-    cache.set("manual-key", json.dumps(payload))
-
-    async def failing_acompletion(*args: object, **kwargs: object) -> dict[str, object]:
-        raise AssertionError("LLM should not be invoked when cache is hit")
-
-    monkeypatch.setattr(
-        "tesseract_flow.evaluation.rubric.litellm.acompletion",
-        failing_acompletion,
-    )
+    cache.set("manual-key", _UNIFORM_PAYLOAD_JSON)
+    fake_litellm.side_effect = AssertionError("LLM should not be invoked when cache is hit")
 
     evaluator = RubricEvaluator(cache=cache)
     score = await evaluator.evaluate("Example output", use_cache=True, cache_key="manual-key")
 
+    fake_litellm.assert_not_awaited()
     assert score.metadata["cache_hit"] is True
     assert "cache_recorded" not in score.metadata
     assert score.overall_score == pytest.approx(0.6)
 
 
 @pytest.mark.asyncio
-async def test_evaluate_requires_cache_backend_when_requested() -> None:
-    evaluator = RubricEvaluator()
+async def test_evaluate_requires_cache_backend_when_requested(evaluator: RubricEvaluator) -> None:
     with pytest.raises(EvaluationError):
         await evaluator.evaluate("Output", use_cache=True)
 
 
-def test_load_json_parses_pure_json() -> None:
+def test_load_json_parses_pure_json(evaluator: RubricEvaluator) -> None:
     """Test parsing pure JSON (DeepSeek format)."""
-    evaluator = RubricEvaluator()
     content = '{"clarity": {"score": 80, "reasoning": "Clear output"}}'
     result = evaluator._load_json(content)
     assert result["clarity"]["score"] == 80
 
 
-def test_load_json_parses_json_with_preamble() -> None:
+def test_load_json_parses_json_with_preamble(evaluator: RubricEvaluator) -> None:
     """Test parsing JSON with preamble text (Haiku format)."""
-    evaluator = RubricEvaluator()
     content = """I'll carefully evaluate the output against the rubric:
 
 {
@@ -248,9 +193,8 @@ def test_load_json_parses_json_with_preamble() -> None:
     assert result["accuracy"]["score"] == 85
 
 
-def test_load_json_parses_markdown_fenced() -> None:
+def test_load_json_parses_markdown_fenced(evaluator: RubricEvaluator) -> None:
     """Test parsing JSON wrapped in markdown code fences."""
-    evaluator = RubricEvaluator()
     content = """```json
 {
   "clarity": {
@@ -263,9 +207,8 @@ def test_load_json_parses_markdown_fenced() -> None:
     assert result["clarity"]["score"] == 90
 
 
-def test_load_json_fails_on_invalid_json() -> None:
+def test_load_json_fails_on_invalid_json(evaluator: RubricEvaluator) -> None:
     """Test that invalid JSON raises EvaluationError."""
-    evaluator = RubricEvaluator()
     content = "This is not JSON at all"
     with pytest.raises(EvaluationError, match="Evaluator response was not valid JSON"):
         evaluator._load_json(content)
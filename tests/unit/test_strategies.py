@@ -1,8 +1,9 @@
-import asyncio
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 
+from tesseract_flow.core import strategies
 from tesseract_flow.core.strategies import (
     GENERATION_STRATEGIES,
     StandardStrategy,
@@ -12,49 +13,35 @@ from tesseract_flow.core.strategies import (
 )
 
 
-def test_standard_strategy_uses_litellm(monkeypatch: pytest.MonkeyPatch) -> None:
-    captured_args: dict[str, Any] = {}
-
-    async def fake_completion(**kwargs: Any) -> dict[str, Any]:
-        captured_args.update(kwargs)
-        return {"choices": [{"message": {"content": " result "}}]}
-
-    monkeypatch.setattr(
-        "tesseract_flow.core.strategies.litellm.acompletion", fake_completion, raising=False
-    )
+@pytest.mark.asyncio
+async def test_standard_strategy_uses_litellm(fake_litellm: AsyncMock) -> None:
+    fake_litellm.return_value = {"choices": [{"message": {"content": " result "}}]}
 
     strategy = StandardStrategy()
-    result = asyncio.run(
-        strategy.generate("Prompt", model="test-model", config={"temperature": 0.5})
-    )
+    result = await strategy.generate("Prompt", model="test-model", config={"temperature": 0.5})
     assert result == "result"
-    assert captured_args["temperature"] == 0.5
-    assert captured_args["model"] == "test-model"
-
+    fake_litellm.assert_awaited_once_with(
+        model="test-model",
+        messages=[{"role": "user", "content": "Prompt"}],
+        temperature=0.5,
+    )
 
-def test_standard_strategy_returns_empty_string(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_completion(**kwargs: Any) -> dict[str, Any]:
-        return {"choices": []}
 
-    monkeypatch.setattr(
-        "tesseract_flow.core.strategies.litellm.acompletion", fake_completion, raising=False
-    )
+@pytest.mark.asyncio
+async def test_standard_strategy_returns_empty_string(fake_litellm: AsyncMock) -> None:
+    fake_litellm.return_value = {"choices": []}
 
     strategy = StandardStrategy()
-    result = asyncio.run(strategy.generate("Prompt", model="test-model"))
+    result = await strategy.generate("Prompt", model="test-model")
     assert result == ""
 
 
-def test_standard_strategy_flattens_list_content(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_completion(**kwargs: Any) -> dict[str, Any]:
-        return {"choices": [{"message": {"content": [" part1", " part2 "]}}]}
-
-    monkeypatch.setattr(
-        "tesseract_flow.core.strategies.litellm.acompletion", fake_completion, raising=False
-    )
+@pytest.mark.asyncio
+async def test_standard_strategy_flattens_list_content(fake_litellm: AsyncMock) -> None:
+    fake_litellm.return_value = {"choices": [{"message": {"content": [" part1", " part2 "]}}]}
 
     strategy = StandardStrategy()
-    result = asyncio.run(strategy.generate("Prompt", model="test-model"))
+    result = await strategy.generate("Prompt", model="test-model")
     assert result == "part1 part2"
 
 
@@ -63,18 +50,20 @@ def test_get_strategy_returns_registered_strategy() -> None:
     assert isinstance(strategy, GenerationStrategy)
 
 
-def test_register_strategy_adds_new_strategy() -> None:
+@pytest.mark.asyncio
+async def test_register_strategy_adds_new_strategy(monkeypatch: pytest.MonkeyPatch) -> None:
     class DummyStrategy:
         async def generate(self, prompt: str, *, model: str, config: dict[str, Any] | None = None) -> str:
             return f"{model}:{prompt}"
 
+    # Register into a throwaway copy of the registry; monkeypatch restores the original.
+    monkeypatch.setattr(strategies, "GENERATION_STRATEGIES", dict(GENERATION_STRATEGIES))
     register_strategy("dummy", DummyStrategy())
-    try:
-        strategy = get_strategy("dummy")
-        assert isinstance(strategy, DummyStrategy)
-        assert asyncio.run(strategy.generate("hello", model="model")) == "model:hello"
-    finally:
-        GENERATION_STRATEGIES.pop("dummy", None)
+
+    strategy = get_strategy("dummy")
+    assert isinstance(strategy, DummyStrategy)
+    assert await strategy.generate("hello", model="model") == "model:hello"
+    assert "dummy" not in GENERATION_STRATEGIES
 
 
 def test_get_strategy_unknown_name_raises() -> None:
@@ -3,25 +3,23 @@ import pytest
 from tesseract_flow.core.types import UtilityWeights
 from tesseract_flow.optimization.utility import UtilityFunction
 
+# UtilityWeights is frozen and UtilityFunction keeps no state, so both are safe to share.
+_WEIGHTS = UtilityWeights(quality=1.0, cost=0.5, time=0.25)
+_FN = UtilityFunction(_WEIGHTS)
 
-def test_utility_function_compute_for_sequences_normalizes_values() -> None:
-    weights = UtilityWeights(quality=1.0, cost=0.5, time=0.25)
-    utility_fn = UtilityFunction(weights)
 
+def test_utility_function_compute_for_sequences_normalizes_values() -> None:
     qualities = [0.5, 0.75, 0.9]
     costs = [0.01, 0.02, 0.03]
     latencies = [1000, 1500, 2000]
 
-    utilities = utility_fn.compute_for_sequences(qualities, costs, latencies)
+    utilities = _FN.compute_for_sequences(qualities, costs, latencies)
 
-    assert len(utilities) == 3
-    normalized_costs, _ = UtilityFunction.normalize_metrics(costs)
-    normalized_latencies, _ = UtilityFunction.normalize_metrics(latencies)
+    # Costs and latencies are evenly spaced, so both normalize to [0.0, 0.5, 1.0].
     expected = [
-        weights.quality * q
-        - weights.cost * cost
-        - weights.time * latency
-        for q, cost, latency in zip(qualities, normalized_costs, normalized_latencies)
+        1.0 * 0.5 - 0.5 * 0.0 - 0.25 * 0.0,
+        1.0 * 0.75 - 0.5 * 0.5 - 0.25 * 0.5,
+        1.0 * 0.9 - 0.5 * 1.0 - 0.25 * 1.0,
     ]
     assert utilities == pytest.approx(expected)
 